@@ -0,0 +1 @@
+"""Release email rendering."""
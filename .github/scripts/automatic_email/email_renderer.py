@@ -0,0 +1,139 @@
+import html
+import logging
+import os
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Matches {{key}} placeholders in the email template
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+# Define a dictionary to map repository names to application names
+REPO_APP_MAPPING = {
+    "datamaster-dev-standards": "DataMaster Dev Standards",
+    "DMAdministration": "Administration",
+    "DMDashbord": "Dashboard",
+    "DMExpoImpo": "Import et Export",
+    "DMInventorying": "Stock",
+    "DMPriceViewer": "Price Viewer",
+    "DMReferentiel": "Referentiel",
+    "DMSPOS": "POS",
+    "DMSPurchase": "Commercial",
+    "DMSTASK": "TASK",
+    "TaskWeb": "TASK Web",
+    # Add more mappings as needed
+}
+
+DEFAULT_TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "email_template.html")
+
+
+class CompiledTemplate:
+    """Email template split once into literal chunks and placeholder keys"""
+
+    def __init__(self, source: str):
+        # split() alternates literal text and captured keys: [text, key, text, ..., text]
+        chunks = PLACEHOLDER_PATTERN.split(source)
+        self._literals = chunks[0::2]
+        self._keys = chunks[1::2]
+        self.placeholders: FrozenSet[str] = frozenset(self._keys)
+
+    def check(self, context: Dict) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Return the (missing, unknown) keys of a context"""
+        keys = frozenset(context)
+        return self.placeholders - keys, keys - self.placeholders
+
+    def render(self, context: Dict, strict: bool = False) -> str:
+        """Render the template in a single pass, missing keys are left as-is"""
+        missing, unknown = self.check(context)
+        if missing:
+            if strict:
+                raise KeyError(f"Missing template keys: {sorted(missing)}")
+            logger.warning(f"Missing template keys: {sorted(missing)}")
+        if unknown:
+            logger.warning(f"Unknown template keys: {sorted(unknown)}")
+
+        parts = [None] * (len(self._literals) + len(self._keys))
+        parts[0::2] = self._literals
+        parts[1::2] = [
+            str(context[key]) if key in context else f"{{{{{key}}}}}"
+            for key in self._keys
+        ]
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=None)
+def _compile_file(template_path: str, mtime_ns: int) -> CompiledTemplate:
+    with open(template_path, 'r', encoding='utf-8') as file:
+        return CompiledTemplate(file.read())
+
+
+def load_template(template_path: str = DEFAULT_TEMPLATE_PATH) -> CompiledTemplate:
+    """Compile a template file, reusing the compiled form until the file changes"""
+    path = os.path.abspath(template_path)
+    return _compile_file(path, os.stat(path).st_mtime_ns)
+
+
+def build_context(repo_name: str, tag_name: str, **extra: str) -> Dict[str, str]:
+    """Build the template context for a repository release"""
+    now = datetime.now()
+    context = {
+        "appName": REPO_APP_MAPPING.get(repo_name, "Unknown"),
+        "tagName": tag_name,
+        "date": now.strftime('%Y-%m-%d'),
+        "year": now.strftime('%Y'),
+        # Filled in when the email is rendered from a changelog run
+        "releaseSummary": ""
+    }
+    context.update(extra)
+    return context
+
+
+def render_release_summary(type_counts: List[Tuple[str, int]], top_items: List[str]) -> str:
+    """Render the inline release summary block (per-type counts and top items)"""
+    if not type_counts:
+        return ""
+
+    rows = '\n'.join(
+        f"          <tr><td>{html.escape(label)}</td><td>{count}</td></tr>"
+        for label, count in type_counts
+    )
+    items = '\n'.join(f"          <li>{html.escape(item)}</li>" for item in top_items)
+    return '\n'.join([
+        '      <div class="details summary">',
+        '        <h2>Release Summary:</h2>',
+        '        <table>',
+        rows,
+        '        </table>',
+        *(['        <h2>Highlights:</h2>', '        <ul>', items, '        </ul>'] if top_items else []),
+        '      </div>'
+    ])
+
+
+def render_email(template_path: str, output_path: str, context: Dict, strict: bool = False) -> str:
+    """Render a template to output_path and return the output path"""
+    content = load_template(template_path).render(context, strict=strict)
+    with open(output_path, 'w', encoding='utf-8') as file:
+        file.write(content)
+    return output_path
+
+
+def render_batch(
+        template_path: str,
+        output_dir: str,
+        tag_name: str,
+        repo_names: Optional[Iterable[str]] = None
+) -> Dict[str, str]:
+    """Render one email per repository from the same compiled template"""
+    template = load_template(template_path)
+    os.makedirs(output_dir, exist_ok=True)
+
+    outputs = {}
+    for repo_name in repo_names or REPO_APP_MAPPING:
+        output_path = os.path.join(output_dir, f"email_output_{repo_name}.html")
+        with open(output_path, 'w', encoding='utf-8') as file:
+            file.write(template.render(build_context(repo_name, tag_name)))
+        outputs[repo_name] = output_path
+    return outputs
@@ -1,55 +1,38 @@
+import argparse
 import os
-from datetime import datetime
 
-def populate_email_template(template_path, output_path, context):
-    # Read the template
-    with open(template_path, 'r') as file:
-        template = file.read()
+from .email_renderer import DEFAULT_TEMPLATE_PATH, build_context, render_batch, render_email
 
-    # Replace placeholders with context data
-    for key, value in context.items():
-        template = template.replace(f"{{{{{key}}}}}", value)
+def populate_email_template(template_path, output_path, context):
+    # Placeholders are located once per template and rendered in a single pass
+    render_email(template_path, output_path, context)
 
-    # Write the populated template to a new file
-    with open(output_path, 'w') as file:
-        file.write(template)
+def main():
+    parser = argparse.ArgumentParser(description="Populate the release email template")
+    parser.add_argument("--repos", nargs="*",
+                        help="render one email per repository instead of the current one (no names: all known repositories)")
+    parser.add_argument("--output-dir", default=".github/scripts/automatic_email",
+                        help="directory for per-repository emails")
+    args = parser.parse_args()
 
-if __name__ == "__main__":
     # Environment variables for dynamic data
+    tag_name = os.getenv("TAG_NAME", "Unknown Tag")
 
-    # Define a dictionary to map repository names to application names
-    REPO_APP_MAPPING = {
-        "datamaster-dev-standards": "DataMaster Dev Standards",
-        "DMAdministration": "Administration",
-        "DMDashbord": "Dashboard",
-        "DMExpoImpo": "Import et Export",
-        "DMInventorying": "Stock",
-        "DMPriceViewer": "Price Viewer",
-        "DMReferentiel": "Referentiel",
-        "DMSPOS": "POS",
-        "DMSPurchase": "Commercial",
-        "DMSTASK": "TASK",
-        "TaskWeb": "TASK Web",
-        # Add more mappings as needed
-    }
-
-    # Get the repository name from the environment
-    repo_name = os.getenv("REPO_NAME", "Unknown Repository")
-
-    # Get the application name based on the repository name
-    app_name = REPO_APP_MAPPING.get(repo_name, "Unknown")
-
-    context = {
-        "appName": app_name,
-        "tagName": os.getenv("TAG_NAME", "Unknown Tag"),
-        "date": datetime.now().strftime('%Y-%m-%d'),
-        "year": datetime.now().strftime('%Y')
-    }
-
-    # Template file paths
-    template_path = ".github/scripts/automatic_email/email_template.html"
+    # Template file paths, the template ships with the package
+    template_path = DEFAULT_TEMPLATE_PATH
     output_path = ".github/scripts/automatic_email/email_output.html"
 
-    # Populate and save the template
-    populate_email_template(template_path, output_path, context)
-    print(f"Populated email saved to {output_path}")
\ No newline at end of file
+    if args.repos is not None:
+        outputs = render_batch(template_path, args.output_dir, tag_name, args.repos)
+        print(f"Populated {len(outputs)} emails in {args.output_dir}")
+    else:
+        # Get the repository name from the environment
+        repo_name = os.getenv("REPO_NAME", "Unknown Repository")
+
+        # Populate and save the template
+        populate_email_template(template_path, output_path, build_context(repo_name, tag_name))
+        print(f"Populated email saved to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
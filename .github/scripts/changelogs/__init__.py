@@ -0,0 +1 @@
+"""Changelog generation and commit message validation for the DataMaster repositories."""
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List, Union, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, List, Union, Tuple
 
-from git import Tag, Commit
+if TYPE_CHECKING:
+    # GitPython is only needed by the fetcher implementation
+    from git import Tag, Commit
 
 
 # Base classes and interfaces
@@ -19,14 +21,14 @@ class CommitFetcher(ABC):
     @abstractmethod
     def get_commits_between_refs(
         self,
-        base_ref: Union[Tag, Commit],
-        head_ref: Union[Tag, Commit]
+        base_ref: Union["Tag", "Commit"],
+        head_ref: Union["Tag", "Commit"]
     ) -> List[Dict]:
         """Get commits between two refs (tags or commits)"""
         pass
 
     @abstractmethod
-    def get_commit_from_tag(self, tag: str) -> Commit:
+    def get_commit_from_tag(self, tag: str) -> "Commit":
         """Get commit object from tag name"""
         pass
 
@@ -40,6 +42,9 @@ class CommitParser(ABC):
         pass
 
 class ReportStrategy(ABC):
+    # Extension of the files written for this report
+    file_extension = "html"
+
     @abstractmethod
     def generate(
         self, 
@@ -47,4 +52,13 @@ class ReportStrategy(ABC):
         current_tag: Optional[str] = None,
         previous_tag: Optional[str] = None
     ) -> str:
-        pass
\ No newline at end of file
+        pass
+
+    def stream(
+        self,
+        commits: Dict,
+        current_tag: Optional[str] = None,
+        previous_tag: Optional[str] = None
+    ) -> Iterator[str]:
+        """Yield the report in chunks, defaults to the whole generated document"""
+        yield self.generate(commits, current_tag, previous_tag)
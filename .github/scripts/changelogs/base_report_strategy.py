@@ -1,5 +1,8 @@
-from base_interfaces import ReportStrategy
-from style_config import StyleConfig
+import html
+from .base_interfaces import ReportStrategy
+from .commit_stats import ISO_DATE_FORMAT, commit_identities, commit_stats, format_duration
+from .style_config import StyleConfig
+from datetime import datetime
 from typing import Dict, List, Optional
 
 class BaseReportStrategy(ReportStrategy, StyleConfig):
@@ -30,6 +33,110 @@ class BaseReportStrategy(ReportStrategy, StyleConfig):
             "</header>"
         ])
 
+    @staticmethod
+    def _format_day(iso_date: str) -> str:
+        if not iso_date:
+            return "-"
+        return datetime.strptime(iso_date, ISO_DATE_FORMAT).strftime("%d %b %Y")
+
+    def _generate_stats_section(self, commits: Dict) -> str:
+        """Generate the summary header from the stats collected while categorizing"""
+        stats = commit_stats(commits)
+        if not stats.count:
+            return ""
+
+        cards = [
+            ("Commits", stats.count),
+            ("Contributors", len(stats.authors)),
+            ("Scopes", len(stats.scopes)),
+            ("Lead time", format_duration(stats.lead_time))
+        ]
+        doc = [
+            "<section class='stats'>",
+            "<div class='stats-grid'>",
+            *[f"<div class='stat-card'><div class='stat-value'>{value}</div>"
+              f"<div class='stat-label'>{label}</div></div>" for label, value in cards],
+            "</div>",
+            "<div class='stats-types'>",
+            *[f"<span class='stat-type type-{type_name}'>{self.TYPE_STYLES[type_name]['emoji']} "
+              f"{type_name} {stats.types[type_name]}</span>"
+              for type_name in self.PRIORITY_ORDER if stats.types[type_name]],
+            "</div>",
+            "<table class='stats-table'>",
+            "<thead><tr><th>Scope</th><th>Commits</th><th>Contributors</th><th>First</th><th>Last</th></tr></thead>",
+            "<tbody>"
+        ]
+        for scope, scope_stats in sorted(stats.scopes.items(), key=lambda item: -item[1].count):
+            doc.append(
+                f"<tr><td>{scope}</td><td>{scope_stats.count}</td><td>{len(scope_stats.authors)}</td>"
+                f"<td>{self._format_day(scope_stats.first_date)}</td>"
+                f"<td>{self._format_day(scope_stats.last_date)}</td></tr>"
+            )
+        doc.extend([
+            "</tbody>",
+            "</table>",
+            "<p class='stats-authors'>👤 " + ", ".join(
+                f"{author} ({count})" for author, count in stats.top_authors()
+            ) + "</p>",
+            "</section>"
+        ])
+        return '\n'.join(doc)
+
+    def _format_ref(self, ref: str, ticket: Optional[Dict]) -> str:
+        """A ref as a link to its ticket with the ticket title, or as is when unresolved"""
+        if not ticket:
+            return ref
+        # Ticket fields come from the tracker, they are escaped unlike commit messages
+        title = html.escape(str(ticket.get('title', '')))
+        status = ticket.get('status')
+        status = f" <span class='ticket-status'>{html.escape(str(status))}</span>" if status else ""
+        url = str(ticket.get('url', ''))
+        link = f"<a href=\"{html.escape(url, quote=True)}\">{ref}</a>" if url.startswith(('https://', 'http://')) else ref
+        return f"{link} {title}{status}"
+
+    def _generate_refs_section(self, commits: Dict) -> str:
+        """Generate the per-ticket view from the ref index built while categorizing"""
+        identities = commit_identities(commits)
+        commits_by_ref = identities.commits_by_ref
+        if not commits_by_ref:
+            return ""
+        tickets = getattr(commits, 'tickets', {})
+
+        doc = ['<div class="type-header type-chore">🔗 Tickets</div>']
+        for ref in sorted(commits_by_ref):
+            doc.extend([
+                "<details>",
+                f"<summary>{self._format_ref('#' + identities.ref_ids[ref], tickets.get(ref))} • "
+                f"{len(commits_by_ref[ref])} commit(s)</summary>",
+                "<ul class='commit-list'>",
+                *[f"<li class='commit-item'><div class='commit-title'>{commit['title']}</div>"
+                  f"<div class='commit-meta'>👤 {commit['author']} • 📅 {commit['date']}</div></li>"
+                  for commit in commits_by_ref[ref]],
+                "</ul>",
+                "</details>"
+            ])
+        return '\n'.join(doc)
+
+    def _generate_authors_section(self, commits: Dict) -> str:
+        """Generate the per-author view from the author index built while categorizing"""
+        commits_by_author = commit_identities(commits).commits_by_author
+        if not commits_by_author:
+            return ""
+
+        doc = ['<div class="type-header type-chore">👤 Contributors</div>']
+        for author, author_commits in sorted(commits_by_author.items(), key=lambda item: -len(item[1])):
+            doc.extend([
+                "<details>",
+                f"<summary><span class='scope-tag'>{author}</span> {len(author_commits)} commit(s)</summary>",
+                "<ul class='commit-list'>",
+                *[f"<li class='commit-item'><div class='commit-title'>{commit['title']}</div>"
+                  f"<div class='commit-meta'>📅 {commit['date']}</div></li>"
+                  for commit in author_commits],
+                "</ul>",
+                "</details>"
+            ])
+        return '\n'.join(doc)
+
     def _generate_type_section(self, type_name: str, commits_by_scope: Dict) -> str:
         """Generate markup for a commit type section"""
         if not commits_by_scope:
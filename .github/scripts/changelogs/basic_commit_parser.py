@@ -1,33 +1,18 @@
 
 import logging
-import re
 from typing import Dict, Optional
 
-from base_interfaces import CommitParser
+from .base_interfaces import CommitParser
+from .commit_grammar import COMMIT_PATTERN, TYPES
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 class BasicCommitParser(CommitParser):
-    TYPES = ["feat", "fix", "docs", "style", "refactor", "perf", "test", "chore"]
+    # Same grammar as the commit-msg hook, see commit_grammar
+    TYPES = TYPES
 
     def __init__(self):
-        self.commit_pattern = self._create_commit_pattern()
-
-    def _create_commit_pattern(self):
-        type_regex = "|".join(self.TYPES)
-        return re.compile(
-            r"^(?P<type>" + type_regex + r")"
-            r"\((?P<scope>[^)]+)\):\s*"
-            r"(?P<title>[^\n]+)"
-            r"(?:(?P<body>[\s\S]*?))?"
-            r"(?:\nRefs:\s*(?P<refs>#[A-Za-z0-9-]+(?:,\s*#[A-Za-z0-9-]+)*))?"
-            r"$", re.DOTALL
-        )
+        self.commit_pattern = COMMIT_PATTERN
 
     def parse(self, message: str) -> Optional[Dict]:
         if not message or not isinstance(message, str):
@@ -1,13 +1,22 @@
-from base_interfaces import CommitFetcher, CommitParser
-from commit_info import CommitInfo
-from basic_commit_parser import BasicCommitParser
+from .base_interfaces import CommitFetcher, CommitParser
+from .commit_info import CommitInfo
+from .basic_commit_parser import BasicCommitParser
+from .commit_stats import CategorizedCommits
+from .identity_index import IdentityIndex, Mailmap
 from datetime import datetime
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 class CommitDocumentManager:
-    def __init__(self, commit_fetcher: CommitFetcher, commit_parser: CommitParser):
+    def __init__(
+        self,
+        commit_fetcher: CommitFetcher,
+        commit_parser: CommitParser,
+        mailmap: Optional[Mailmap] = None
+    ):
         self.commit_fetcher = commit_fetcher
         self.commit_parser = commit_parser
+        # Author normalisation, loaded once and shared by every categorize run
+        self.mailmap = mailmap or Mailmap()
 
     def _parse_commit_date(self, date_str: str) -> str:
         """Format commit date string"""
@@ -16,16 +25,28 @@ class CommitDocumentManager:
             "%Y-%m-%dT%H:%M:%SZ"
         ).strftime("%d %B %Y %H:%M")
 
-    def _create_commit_info(self, commit: Dict, parsed: Dict) -> CommitInfo:
+    def _create_commit_info(
+        self,
+        commit: Dict,
+        parsed: Dict,
+        identities: Optional[IdentityIndex] = None
+    ) -> CommitInfo:
         """Create CommitInfo from raw commit and parsed data"""
+        author = commit["commit"]["author"]
+        name, email = author["name"], author.get("email", "")
+        if identities is not None:
+            name, email = identities.identity(name, email)
         return CommitInfo(
             type=parsed["type"],
             scope=parsed["scope"],
             title=parsed["title"],
             body=parsed["body"] or "",
             refs=parsed["refs"],
-            author=commit["commit"]["author"]["name"],
-            date=self._parse_commit_date(commit["commit"]["author"]["date"])
+            author=name,
+            date=self._parse_commit_date(author["date"]),
+            sha=commit.get("sha", ""),
+            iso_date=author["date"],
+            email=email
         )
 
     def _get_commit_id(self, info: CommitInfo) -> Tuple:
@@ -42,22 +63,30 @@ class CommitDocumentManager:
         self, 
         categorized: Dict, 
         info: CommitInfo
-    ) -> None:
-        """Add commit info to categorized dictionary"""
+    ) -> Dict:
+        """Add commit info to categorized dictionary and return its entry"""
         if info.scope not in categorized[info.type]:
             categorized[info.type][info.scope] = []
-            
-        categorized[info.type][info.scope].append({
+
+        entry = {
             "title": info.title,
             "body": info.body,
             "author": info.author,
+            "email": info.email,
             "date": info.date,
-            "refs": info.refs
-        })
+            "refs": info.refs,
+            "sha": info.sha,
+            "iso_date": info.iso_date
+        }
+        categorized[info.type][info.scope].append(entry)
+        return entry
 
-    def categorize_commits(self, commits: List[Dict]) -> Dict:
-        """Categorize commits by type and scope"""
-        categorized = {t: {} for t in BasicCommitParser.TYPES}
+    def categorize_commits(self, commits: List[Dict]) -> CategorizedCommits:
+        """Categorize commits by type and scope, collecting their stats in the same pass"""
+        categorized = CategorizedCommits(
+            ((t, {}) for t in BasicCommitParser.TYPES),
+            identities=IdentityIndex(self.mailmap)
+        )
         seen: Set[Tuple] = set()
 
         for commit in commits:
@@ -67,7 +96,7 @@ class CommitDocumentManager:
                 continue
 
             # Create commit info object
-            commit_info = self._create_commit_info(commit, parsed)
+            commit_info = self._create_commit_info(commit, parsed, categorized.identities)
             commit_id = self._get_commit_id(commit_info)
 
             # Skip if already processed
@@ -76,7 +105,9 @@ class CommitDocumentManager:
 
             # Add to categories and mark as seen
             seen.add(commit_id)
-            self._add_to_categories(categorized, commit_info)
+            entry = self._add_to_categories(categorized, commit_info)
+            categorized.identities.add(entry)
+            categorized.stats.add(commit_info.type, commit_info.author, commit_info.iso_date, commit_info.scope)
 
         return categorized
    
\ No newline at end of file
@@ -2,14 +2,14 @@
 import requests
 from git import Tag, Commit
 
-from base_interfaces import CommitFetcher
+from .base_interfaces import CommitFetcher
+from .metrics import PipelineMetrics
+from .rate_limit import RateLimitBudget, RateLimitExceeded
 from typing import Dict, List, Tuple, Optional, Union
 import logging
+import os
+import time
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 from git import Repo, Commit
@@ -96,7 +96,14 @@ from git import Repo, Commit
 
 
 class GitHubCommitFetcher(CommitFetcher):
-    def __init__(self, github_token: str, repo_owner: str, repo_name: str):
+    def __init__(
+        self,
+        github_token: str,
+        repo_owner: str,
+        repo_name: str,
+        metrics: Optional[PipelineMetrics] = None,
+        budget: Optional[RateLimitBudget] = None
+    ):
         self.github_token = github_token
         self.repo_owner = repo_owner
         self.repo_name = repo_name
@@ -106,14 +113,38 @@ class GitHubCommitFetcher(CommitFetcher):
             "Accept": "application/vnd.github.v3+json"
         }
         self.repo = Repo('.')
+        self.metrics = metrics or PipelineMetrics()
+        # Share one budget between fetchers using the same token (e.g. backfills of several repos)
+        self.budget = budget or RateLimitBudget(cache_path=os.getenv('GITHUB_API_CACHE_PATH'))
+
+    def _get(self, url: str, params: Optional[Dict] = None) -> requests.Response:
+        """GET a GitHub API url within the rate-limit budget, recording each attempt"""
+        key = self.budget.cache_key(url, params)
+        attempt = 0
+        while True:
+            conditional_headers = self.budget.conditional_headers(key)
+            self.budget.acquire(conditional=bool(conditional_headers))
+
+            start = time.perf_counter()
+            try:
+                response = requests.get(url, headers={**self.headers, **conditional_headers}, params=params)
+            except requests.RequestException as e:
+                self.metrics.record_request("GET", url, time.perf_counter() - start, error=str(e))
+                raise
+            self.metrics.record_request("GET", url, time.perf_counter() - start, response)
+            self.budget.update(response)
+
+            delay = self.budget.retry_delay(response, attempt)
+            if delay is None:
+                return self.budget.resolve(key, response)
+            logger.warning(f"Rate limited on {url} (HTTP {response.status_code}), retrying in {delay:.0f}s")
+            self.budget.pause(delay)
+            attempt += 1
 
     def get_tags(self) -> Tuple[Optional[str], Optional[str]]:
         """Get latest and previous tags if available"""
         try:
-            response = requests.get(
-                f"{self.base_url}/tags",
-                headers=self.headers
-            )
+            response = self._get(f"{self.base_url}/tags")
             response.raise_for_status()
             tags = response.json()
 
@@ -127,6 +158,8 @@ class GitHubCommitFetcher(CommitFetcher):
                 logger.info("No tags found")
                 return None, None
 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error fetching tags: {e}")
             return None, None
@@ -135,6 +168,10 @@ class GitHubCommitFetcher(CommitFetcher):
         """Get commit object from tag name"""
         return self.repo.commit(tag)
 
+    def get_parents(self, sha: str) -> List[str]:
+        """Parent SHAs of a commit from the local clone"""
+        return [parent.hexsha for parent in self.repo.commit(sha).parents]
+
     def get_commits_between_refs(
         self,
         base_ref: Union[Tag, Commit],
@@ -147,13 +184,12 @@ class GitHubCommitFetcher(CommitFetcher):
 
             logger.info(f"Comparing {base_sha[:7]} to {head_sha[:7]}")
 
-            response = requests.get(
-                f"{self.base_url}/compare/{base_sha}...{head_sha}",
-                headers=self.headers
-            )
+            response = self._get(f"{self.base_url}/compare/{base_sha}...{head_sha}")
             response.raise_for_status()
             return response.json().get('commits', [])
 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error fetching commits between refs: {e}")
             return []
@@ -177,9 +213,8 @@ class GitHubCommitFetcher(CommitFetcher):
 
         while True:
             try:
-                response = requests.get(
+                response = self._get(
                     f"{self.base_url}/commits",
-                    headers=self.headers,
                     params={"sha": branch, "page": page}
                 )
                 response.raise_for_status()
@@ -188,6 +223,8 @@ class GitHubCommitFetcher(CommitFetcher):
                     break
                 commits.extend(data)
                 page += 1
+            except RateLimitExceeded:
+                raise
             except Exception as e:
                 logger.error(f"Error fetching commits: {e}")
                 break
@@ -0,0 +1,34 @@
+import re
+
+# Commit message grammar shared by the commit-msg hook validator and the changelog parser:
+#
+#   <type>(<scope>): <Short description>
+#
+#   [body]
+#
+#   [Refs: #ID[, #ID...]]
+
+TYPES = ["feat", "fix", "docs", "style", "refactor", "perf", "test", "chore"]
+
+SHORT_DESC_LENGTH = 120
+
+TYPE_REGEX = "|".join(TYPES)
+SCOPE_REGEX = r"[^)]+"
+REF_REGEX = r"#[A-Za-z0-9-]+"
+REFS_REGEX = REF_REGEX + r"(?:,\s*" + REF_REGEX + r")*"
+
+# Loose header used by the validator to report which part is wrong
+HEADER_PATTERN = re.compile(r"^(?P<type>[a-zA-Z]*)\((?P<scope>[^)]*)\):(?P<title>.*)$")
+
+# A "Refs:" trailer line
+REFS_LINE_PATTERN = re.compile(r"^Refs:\s*(?P<refs>" + REFS_REGEX + r")\s*$")
+
+# Full message with a known type, as consumed by the changelog parser
+COMMIT_PATTERN = re.compile(
+    r"^(?P<type>" + TYPE_REGEX + r")"
+    r"\((?P<scope>" + SCOPE_REGEX + r")\):\s*"
+    r"(?P<title>[^\n]+)"
+    r"(?:(?P<body>[\s\S]*?))?"
+    r"(?:\nRefs:\s*(?P<refs>" + REFS_REGEX + r"))?"
+    r"$", re.DOTALL
+)
@@ -12,3 +12,6 @@ class CommitInfo:
     refs: List[str]
     author: str
     date: str
+    sha: str = ""
+    iso_date: str = ""
+    email: str = ""
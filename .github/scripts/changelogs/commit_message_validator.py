@@ -0,0 +1,289 @@
+"""Commit message validation engine used by the commit-msg hook.
+
+Usage (from .github/scripts, or with the package installed):
+    python3 -m changelogs.commit_message_validator [--scopes SCOPE ... | --scopes-file FILE] [--] <message file | message>
+    python3 -m changelogs.commit_message_validator [--scopes-file FILE] --range <before>..<after> [--max-count N]
+    python3 -S -m changelogs.commit_message_validator --hook <scopes file> <message file | message>
+
+Prints the success message and exits 0 for a valid message, otherwise prints
+the error message (and an optional tip on a second line) and exits 1.
+
+With --range, every commit of the revision range is read from a single
+`git log -z` call and validated in-process; a per-commit table is printed and
+the exit status is 1 if any commit is invalid, 2 if the range cannot be read.
+
+--hook is the commit-msg fast path: the scopes of the hook file are compiled
+once into a cache artefact keyed by the file hash, and only the modules
+needed to validate a single message are imported (budget checked by
+scripts/check_import_time.py; the interpreter start dominates the hook's
+latency). An invalid message exits
+with HOOK_INVALID_STATUS there, so the hook can tell it apart from a failing
+engine (any other non-zero status) and fall back to its bash validation.
+
+Errors of the engine itself are reported on stderr with exit status 2.
+"""
+import hashlib
+import marshal
+import os
+import re
+import sys
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .commit_grammar import HEADER_PATTERN, REFS_LINE_PATTERN, SHORT_DESC_LENGTH, TYPES
+from .scope_index import BKTree, ScopeIndex
+
+# Messages shared with the bash commit-msg hook and its test cases
+SUCCESS_MSG = "✅ SUCCESS: Your commit message follows the correct format."
+EMPTY_MSG = "❌ ERROR: Commit message is empty."
+MISSING_SHORT_DESC = "❌ ERROR: Short description is missing or improperly formatted."
+SHORT_DESC_LIMIT = "❌ ERROR: Short description exceeds limit characters."
+INVALID_COMMIT_TYPE = "❌ ERROR: Invalid commit type."
+INVALID_COMMIT_SCOPE = "❌ ERROR: Invalid commit scope."
+MISSING_COMMIT_SCOPE = "❌ ERROR: Commit scope is missing."
+INVALID_REFS_ID = "❌ ERROR: Invalid 'Refs' line."
+INVALID_SHORT_DESC_CAPITAL = "❌ ERROR: Short description should start with a capital letter."
+SHORT_DESC_TIP_MSG = "💡 Tip: Consider shortening your description to fit within the limit."
+
+# Exit status of --hook for an invalid message, distinct from Python's own status 1
+HOOK_INVALID_STATUS = 3
+ERROR_STATUS = 2
+
+# SCOPES=( ... ) array of a scopes.sh file or a generated commit-msg hook
+SCOPES_ARRAY_PATTERN = re.compile(r"^SCOPES=\((?P<scopes>.*?)\)", re.MULTILINE | re.DOTALL)
+
+# Optional SCOPE_CASE="insensitive" in scopes.sh accepts scopes in any case
+SCOPE_CASE_PATTERN = re.compile(r"""^SCOPE_CASE=["']?(?P<case>\w+)""", re.MULTILINE)
+
+
+# Bump when the layout of the cached scope artefact changes
+SCOPES_CACHE_VERSION = 2
+SCOPES_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "datamaster-dev-standards"
+)
+
+
+class ValidationResult:
+    # Plain class rather than a dataclass, keeps the hook import time down
+    __slots__ = ("valid", "message", "tip")
+
+    def __init__(self, valid: bool, message: str, tip: Optional[str] = None):
+        self.valid = valid
+        self.message = message
+        self.tip = tip
+
+
+class CommitMessageValidator:
+    def __init__(
+        self,
+        scopes: Optional[Iterable[str]] = None,
+        case_sensitive: bool = True,
+        scope_index: Optional[ScopeIndex] = None
+    ):
+        # No scopes configured means any scope is accepted
+        if scope_index is None and scopes:
+            scope_index = ScopeIndex(scopes, case_sensitive)
+        self.scopes = scope_index
+        self.types = frozenset(TYPES)
+
+    def _clean(self, message: str) -> str:
+        """Drop git comment lines and surrounding blank lines"""
+        lines = [line for line in message.splitlines() if not line.startswith("#")]
+        return "\n".join(lines).strip()
+
+    def validate(self, message: Optional[str]) -> ValidationResult:
+        message = self._clean(message or "")
+        if not message:
+            return ValidationResult(False, EMPTY_MSG)
+
+        header, _, rest = message.partition("\n")
+        match = HEADER_PATTERN.match(header)
+        if not match or match.group("type") not in self.types:
+            return ValidationResult(False, INVALID_COMMIT_TYPE)
+
+        scope = match.group("scope")
+        if not scope:
+            return ValidationResult(False, MISSING_COMMIT_SCOPE)
+        if self.scopes is not None and scope not in self.scopes:
+            suggestions = self.scopes.suggest(scope)
+            tip = f"💡 Did you mean: {', '.join(suggestions)}?" if suggestions else None
+            return ValidationResult(False, INVALID_COMMIT_SCOPE, tip)
+
+        short_desc = match.group("title").strip()
+        if not short_desc:
+            return ValidationResult(False, MISSING_SHORT_DESC)
+        if not "A" <= short_desc[0] <= "Z":
+            return ValidationResult(False, INVALID_SHORT_DESC_CAPITAL)
+        if len(short_desc) > SHORT_DESC_LENGTH:
+            return ValidationResult(False, SHORT_DESC_LIMIT, SHORT_DESC_TIP_MSG)
+
+        for line in rest.splitlines():
+            if line.startswith("Refs:") and not REFS_LINE_PATTERN.match(line):
+                return ValidationResult(False, INVALID_REFS_ID)
+
+        return ValidationResult(True, SUCCESS_MSG)
+
+
+def parse_scopes(source: str, path: str = "<string>") -> Tuple[List[str], bool]:
+    """Read the SCOPES array and the SCOPE_CASE rule defined in bash source"""
+    import shlex
+
+    match = SCOPES_ARRAY_PATTERN.search(source)
+    if not match:
+        raise ValueError(f"No SCOPES array found in {path}")
+
+    case_match = SCOPE_CASE_PATTERN.search(source)
+    case_sensitive = not case_match or case_match.group("case").lower() != "insensitive"
+    return shlex.split(match.group("scopes"), comments=True), case_sensitive
+
+
+def load_scope_index(path: str) -> ScopeIndex:
+    """Build the scope index of a bash file (scopes.sh or a generated hook)"""
+    with open(path, "r", encoding="utf-8") as file:
+        return ScopeIndex(*parse_scopes(file.read(), path))
+
+
+def load_cached_scope_index(path: str, cache_dir: str = SCOPES_CACHE_DIR) -> ScopeIndex:
+    """Load the scope index of a bash file through a compiled artefact keyed by the file hash"""
+    with open(path, "rb") as file:
+        source = file.read()
+    cache_file = os.path.join(cache_dir, f"scopes-{hashlib.sha1(source).hexdigest()}.marshal")
+
+    try:
+        with open(cache_file, "rb") as file:
+            artefact = marshal.load(file)
+        if artefact.get("version") == SCOPES_CACHE_VERSION:
+            return ScopeIndex(artefact["scopes"], artefact["case_sensitive"], BKTree(artefact["tree"]))
+    except (OSError, EOFError, ValueError, TypeError, AttributeError, KeyError):
+        pass
+
+    index = ScopeIndex(*parse_scopes(source.decode("utf-8"), path))
+    artefact = {
+        "version": SCOPES_CACHE_VERSION,
+        "scopes": [scope for spellings in index.spellings.values() for scope in spellings],
+        "case_sensitive": index.case_sensitive,
+        # Prebuilt suggestion tree, so the hook never rebuilds it
+        "tree": index.tree.root
+    }
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write then rename so concurrent hooks never read a partial artefact
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as file:
+            marshal.dump(artefact, file)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # A read-only cache only costs the parsing on the next run
+        pass
+    return index
+
+
+def iter_commit_messages(rev_range: str, max_count: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+    """Stream (sha, message) pairs of a revision range from a single git log call"""
+    import subprocess
+
+    command = ["git", "log", "-z", "--no-merges", "--format=%H%n%B"]
+    if max_count:
+        command.append(f"--max-count={max_count}")
+    command.append(rev_range)
+
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+        pending = b""
+        for chunk in iter(lambda: process.stdout.read(65536), b""):
+            pending += chunk
+            *records, pending = pending.split(b"\0")
+            for record in records:
+                sha, _, message = record.decode("utf-8", "replace").partition("\n")
+                yield sha, message
+        if pending:
+            sha, _, message = pending.decode("utf-8", "replace").partition("\n")
+            yield sha, message
+        # First line of git's own message, e.g. "fatal: bad revision", ends the error line
+        error = process.stderr.read().decode("utf-8", "replace").strip().splitlines()
+
+    if process.returncode != 0:
+        reason = f": {error[0]}" if error else ""
+        raise RuntimeError(f"git log failed for range '{rev_range}'{reason}")
+
+
+def validate_range(validator: CommitMessageValidator, rev_range: str, max_count: Optional[int] = None) -> int:
+    """Validate every commit of a range and print a per-commit result table"""
+    results = [
+        (sha, message, validator.validate(message))
+        for sha, message in iter_commit_messages(rev_range, max_count)
+    ]
+
+    print(f"{'STATUS':<8}{'COMMIT':<10}{'HEADER':<60}RESULT")
+    for sha, message, result in results:
+        header = message.strip().partition("\n")[0]
+        if len(header) > 57:
+            header = header[:56] + "…"
+        status = "ok" if result.valid else "FAILED"
+        print(f"{status:<8}{sha[:7]:<10}{header:<60}{'' if result.valid else result.message}")
+
+    failed = sum(1 for _, _, result in results if not result.valid)
+    print(f"\n{len(results) - failed}/{len(results)} commit(s) valid")
+    return 1 if failed else 0
+
+
+def read_message(source: str) -> str:
+    """Read the message from a file, or use the argument itself as the message"""
+    if source and os.path.isfile(source):
+        # A stray non-UTF-8 byte must not stop the validation
+        with open(source, "r", encoding="utf-8", errors="replace") as file:
+            return file.read()
+    return source
+
+
+def print_result(result: ValidationResult) -> int:
+    print(result.message)
+    if result.tip:
+        print(result.tip)
+    return 0 if result.valid else 1
+
+
+def run_hook(scopes_file: str, message: str) -> int:
+    """commit-msg fast path, no argument parsing and cached scopes"""
+    validator = CommitMessageValidator(scope_index=load_cached_scope_index(scopes_file))
+    return print_result(validator.validate(read_message(message))) and HOOK_INVALID_STATUS
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        if argv[:1] == ["--hook"] and len(argv) in (2, 3):
+            return run_hook(argv[1], argv[2] if len(argv) == 3 else "")
+        return run(argv)
+    except Exception as e:
+        print(f"commit_message_validator: {e}", file=sys.stderr)
+        return ERROR_STATUS
+
+
+def run(argv: List[str]) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate a commit message")
+    parser.add_argument("--scopes", nargs="*", help="allowed scopes")
+    parser.add_argument("--scopes-file", help="bash file defining the SCOPES array (scopes.sh or commit-msg)")
+    parser.add_argument("--range", dest="rev_range", help="validate every commit of a revision range")
+    parser.add_argument("--max-count", type=int, help="limit the number of commits read from --range")
+    parser.add_argument("message", nargs="?", default="", help="commit message file or message")
+    args = parser.parse_args(argv)
+
+    if args.scopes_file:
+        validator = CommitMessageValidator(scope_index=load_scope_index(args.scopes_file))
+    else:
+        validator = CommitMessageValidator(args.scopes)
+
+    if args.rev_range:
+        try:
+            return validate_range(validator, args.rev_range, args.max_count)
+        except (RuntimeError, OSError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return ERROR_STATUS
+
+    return print_result(validator.validate(read_message(args.message)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
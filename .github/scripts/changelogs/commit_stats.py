@@ -0,0 +1,122 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .identity_index import IdentityIndex
+
+# ISO dates as returned by the GitHub API, they sort as strings
+ISO_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@dataclass
+class ScopeStats:
+    """Running aggregates of the commits of one scope"""
+    count: int = 0
+    first_date: str = ""
+    last_date: str = ""
+    types: Counter = field(default_factory=Counter)
+    authors: Counter = field(default_factory=Counter)
+
+    def add(self, type_name: str, author: str, iso_date: str) -> None:
+        self.count += 1
+        self.types[type_name] += 1
+        self.authors[author] += 1
+        if iso_date:
+            if not self.first_date or iso_date < self.first_date:
+                self.first_date = iso_date
+            if iso_date > self.last_date:
+                self.last_date = iso_date
+
+    @property
+    def lead_time(self) -> Optional[timedelta]:
+        """Time between the first and the last commit"""
+        if not self.first_date:
+            return None
+        return (datetime.strptime(self.last_date, ISO_DATE_FORMAT)
+                - datetime.strptime(self.first_date, ISO_DATE_FORMAT))
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "first_date": self.first_date or None,
+            "last_date": self.last_date or None,
+            "types": dict(self.types),
+            "authors": dict(self.authors)
+        }
+
+
+class CommitStats(ScopeStats):
+    """Aggregates of a whole range, overall and per scope, built while categorizing"""
+
+    def __init__(self):
+        super().__init__()
+        self.scopes: Dict[str, ScopeStats] = {}
+
+    def add(self, type_name: str, author: str, iso_date: str, scope: str = "") -> None:
+        super().add(type_name, author, iso_date)
+        scope_stats = self.scopes.get(scope)
+        if scope_stats is None:
+            scope_stats = self.scopes[scope] = ScopeStats()
+        scope_stats.add(type_name, author, iso_date)
+
+    @classmethod
+    def from_categorized(cls, commits: Dict) -> "CommitStats":
+        """Walk an already categorized dict, for callers that did not collect the stats"""
+        stats = cls()
+        for type_name, commits_by_scope in commits.items():
+            for scope, scope_commits in commits_by_scope.items():
+                for commit in scope_commits:
+                    stats.add(type_name, commit['author'], commit.get('iso_date', ''), scope)
+        return stats
+
+    def top_authors(self, limit: int = 5) -> List[Tuple[str, int]]:
+        return self.authors.most_common(limit)
+
+    def to_dict(self) -> Dict:
+        return {
+            **super().to_dict(),
+            "scopes": {scope: stats.to_dict() for scope, stats in self.scopes.items()}
+        }
+
+
+class CategorizedCommits(dict):
+    """Type -> scope -> commits, with the aggregates and indexes collected in the same pass"""
+
+    def __init__(self, *args, identities: Optional[IdentityIndex] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = CommitStats()
+        self.identities = identities or IdentityIndex()
+        # Ref ID -> ticket resolved from the tracker
+        self.tickets: Dict[str, Dict] = {}
+
+
+def commit_stats(commits: Dict) -> CommitStats:
+    """Stats of categorized commits, only walked again when they were not collected"""
+    stats = getattr(commits, 'stats', None)
+    return stats if stats is not None else CommitStats.from_categorized(commits)
+
+
+def commit_identities(commits: Dict) -> IdentityIndex:
+    """Author and ref index of categorized commits, only walked again when it was not built"""
+    identities = getattr(commits, 'identities', None)
+    if identities is None:
+        identities = IdentityIndex()
+        for commits_by_scope in commits.values():
+            for scope_commits in commits_by_scope.values():
+                for commit in scope_commits:
+                    identities.add(commit)
+    return identities
+
+
+def format_duration(duration: Optional[timedelta]) -> str:
+    """Short human duration, e.g. "3 d 4 h" """
+    if duration is None:
+        return "-"
+    hours, seconds = divmod(int(duration.total_seconds()), 3600)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days} d {hours} h"
+    if hours:
+        return f"{hours} h {seconds // 60} min"
+    return f"{seconds // 60} min"
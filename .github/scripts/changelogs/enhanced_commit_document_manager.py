@@ -1,91 +1,367 @@
-
-# from weasyprint import HTML
-import subprocess
-import pdfkit
 import os
 import logging
-from pathlib import Path
-from commit_document_manager import CommitDocumentManager
-from base_interfaces import CommitFetcher, CommitParser
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Optional, Tuple, Union
+from .commit_document_manager import CommitDocumentManager
+from .commit_stats import commit_stats
+from .identity_index import Mailmap
+from .base_interfaces import CommitFetcher, CommitParser
 from datetime import datetime
-from report_generator_factory import ReportGeneratorFactory
+from .metrics import PipelineMetrics
+from .range_folding import fold_commits
+from .report_generator_factory import ReportGeneratorFactory
+from .style_config import StyleConfig
+from .ticket_resolver import TicketResolver, create_ticket_resolver
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Ranges with at least this many commits render their reports in separate processes,
+# below it the pool startup costs more than rendering inline
+PARALLEL_MIN_COMMITS = int(os.getenv('CHANGELOG_PARALLEL_MIN_COMMITS', '20000'))
+
+# Worker processes used to render, CHANGELOG_WORKERS=1 renders inline
+MAX_WORKERS = int(os.getenv('CHANGELOG_WORKERS', '0')) or os.cpu_count() or 1
+
+# Render input of the worker processes, set once per worker by _init_render_worker
+_render_input: Tuple = ()
+
+
+def write_document(chunks: Iterable[str], filename: str) -> str:
+    """Write content chunks to filename and return it"""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, 'w', encoding='utf-8') as file:
+        for chunk in chunks:
+            file.write(chunk)
+    return filename
+
+
+def _init_render_worker(categorized: Dict, current_tag: Optional[str], previous_tag: Optional[str]) -> None:
+    # Forked workers inherit the arguments, they are not pickled per report
+    global _render_input
+    _render_input = (categorized, current_tag, previous_tag)
+
+
+def _render_report(report_type: str, filename: str) -> Tuple[str, float]:
+    """Render one report in a worker process, returns the file and the time it took"""
+    start = time.perf_counter()
+    categorized, current_tag, previous_tag = _render_input
+    generator = ReportGeneratorFactory.create_generator(report_type)
+    write_document(generator.stream(categorized, current_tag, previous_tag), filename)
+    return filename, time.perf_counter() - start
+
+
 class EnhancedCommitDocumentManager(CommitDocumentManager):
-    def __init__(self, commit_fetcher: CommitFetcher, commit_parser: CommitParser):
+    # Report name -> generator type
+    DEFAULT_REPORTS = {
+        'release_notes': 'release',
+        'commit_report': 'markdown',
+        'commit_data': 'ndjson'
+    }
+
+    # Formats produced from an HTML report when none are configured
+    HTML_FORMATS = ('html', 'pdf')
+
+    # Number of commits listed under the email highlights
+    EMAIL_TOP_ITEMS = 10
+
+    def __init__(
+        self,
+        commit_fetcher: CommitFetcher,
+        commit_parser: CommitParser,
+        reports: Optional[Iterable[str]] = None,
+        metrics: Optional[PipelineMetrics] = None,
+        ticket_resolver: Optional[TicketResolver] = None
+    ):
         super().__init__(commit_fetcher, commit_parser)
-        self.reports = {}
+        # Share the fetcher's metrics so HTTP requests and stages land in one report
+        self.metrics = metrics or getattr(commit_fetcher, 'metrics', None) or PipelineMetrics()
+        # Ticket titles and links for the refs, CHANGELOG_TRACKER=clickup or file
+        self.ticket_resolver = ticket_resolver or create_ticket_resolver(self.metrics)
+        # Reports to produce and their formats, e.g. CHANGELOG_REPORTS="release_notes:html"
+        # for the HTML release notes only; CHANGELOG_PDF=false drops every PDF
+        self.pdf_enabled = os.getenv('CHANGELOG_PDF', 'true').lower() == 'true'
+        self.report_formats: Dict[str, Tuple[str, ...]] = {}
+        self.reports = self._select_reports(reports or os.getenv('CHANGELOG_REPORTS'))
+        # Drop revert pairs and redundant merge commits before categorizing
+        self.fold_enabled = os.getenv('CHANGELOG_FOLD', 'true').lower() == 'true'
+        # Render the release email from this run instead of a separate process
+        self.email_enabled = os.getenv('CHANGELOG_EMAIL', 'false').lower() == 'true'
         # Get workspace root directory
         self.workspace_root = os.getenv('GITHUB_WORKSPACE', os.getcwd())
         self.output_dir = os.path.join(self.workspace_root, 'generated_docs')
-        
+        # Author spellings are normalised with the repository's .mailmap
+        self.mailmap = Mailmap.from_file(
+            os.getenv('CHANGELOG_MAILMAP', os.path.join(self.workspace_root, '.mailmap'))
+        )
+
         # Ensure output directory exists
         os.makedirs(self.output_dir, exist_ok=True)
         logger.info(f"Output directory set to: {self.output_dir}")
+        self.metrics_path = os.getenv('CHANGELOG_METRICS_PATH',
+                                      os.path.join(self.output_dir, 'changelog_metrics.json'))
+
+
+    def _select_reports(self, reports: Optional[Union[str, Iterable[str]]]) -> Dict[str, str]:
+        """Resolve the configured reports ("name" or "name:format+format") to generator types"""
+        if not reports:
+            reports = list(self.DEFAULT_REPORTS)
+        elif isinstance(reports, str):
+            reports = reports.split(',')
+
+        selected = {}
+        self.report_formats = {}
+        for entry in (r.strip() for r in reports):
+            if not entry:
+                continue
+            name, _, formats = entry.partition(':')
+            name = name.strip()
+            if name not in self.DEFAULT_REPORTS:
+                logger.warning(f"Unknown report '{name}', expected one of {list(self.DEFAULT_REPORTS)}")
+                continue
+
+            report_type = self.DEFAULT_REPORTS[name]
+            available = self._available_formats(report_type)
+            requested = [f.strip().lower() for f in formats.split('+') if f.strip()] or list(available)
+            if not self.pdf_enabled and 'pdf' in requested:
+                requested.remove('pdf')
+            unknown = [f for f in requested if f not in available]
+            if unknown:
+                logger.warning(f"Unsupported format(s) {unknown} for report '{name}', expected {list(available)}")
+            requested = [f for f in requested if f in available]
+            if not requested:
+                continue
+
+            selected[name] = report_type
+            self.report_formats[name] = tuple(requested)
+        return selected
 
+    def _available_formats(self, report_type: str) -> Tuple[str, ...]:
+        """Formats a report type can be produced in, PDFs are converted from HTML"""
+        generator = ReportGeneratorFactory.create_generator(report_type)
+        if generator.file_extension == 'html':
+            return self.HTML_FORMATS
+        return (generator.file_extension,)
 
     def generate_all_documents(self):
         try:
-            # Get tags first
-            current_tag_name, previous_tag_name = self.commit_fetcher.get_tags()
+            with self.metrics.timer("resolve tags") as stage:
+                # Get tags first
+                current_tag_name, previous_tag_name = self.commit_fetcher.get_tags()
 
-            # Convert tag names to Commit objects
-            current_tag = self.commit_fetcher.get_commit_from_tag(current_tag_name) if current_tag_name else None
-            previous_tag = self.commit_fetcher.get_commit_from_tag(previous_tag_name) if previous_tag_name else None
+                # Convert tag names to Commit objects
+                current_tag = self.commit_fetcher.get_commit_from_tag(current_tag_name) if current_tag_name else None
+                previous_tag = self.commit_fetcher.get_commit_from_tag(previous_tag_name) if previous_tag_name else None
+                stage.update(current=current_tag_name, previous=previous_tag_name)
 
             logger.info(f"Using refs: {current_tag_name} -> {previous_tag_name}")
 
-            # Get commits between tags if available
-            if current_tag and previous_tag:
-                commits = self.commit_fetcher.get_commits_between_refs(previous_tag, current_tag)
-            else:
-                commits = self.commit_fetcher.fetch_commits()
+            with self.metrics.timer("fetch commits") as stage:
+                # Get commits between tags if available
+                if current_tag and previous_tag:
+                    commits = self.commit_fetcher.get_commits_between_refs(previous_tag, current_tag)
+                else:
+                    commits = self.commit_fetcher.fetch_commits()
+                stage["commits"] = len(commits)
 
-            categorized = self.categorize_commits(commits)
+            if self.fold_enabled:
+                with self.metrics.timer("fold range") as stage:
+                    # Parents come from the payload, local git answers when it has none;
+                    # the commit listing used without two tags is newest first
+                    commits, folded = fold_commits(
+                        commits,
+                        getattr(self.commit_fetcher, 'get_parents', None),
+                        newest_first=not (current_tag and previous_tag)
+                    )
+                    stage.update(kept=len(commits), **folded)
 
-            generators = {
-                'release_notes': ReportGeneratorFactory.create_generator('release'),
-                'commit_report': ReportGeneratorFactory.create_generator('markdown')
-            }
+            with self.metrics.timer("parse and categorize") as stage:
+                categorized = self.categorize_commits(commits)
+                stage["categorized"] = categorized.stats.count
+
+            if self.ticket_resolver and categorized.identities.commits_by_ref:
+                with self.metrics.timer("resolve tickets") as stage:
+                    self.resolve_tickets(categorized)
+                    stage.update(refs=len(categorized.identities.commits_by_ref),
+                                 resolved=len(categorized.tickets))
 
             logger.info(f"Generating documents in: {self.output_dir}")
 
-            for report_name, generator in generators.items():
-                # Generate HTML content
-                content = generator.generate(
-                    commits=categorized,
-                    current_tag=current_tag_name,
-                    previous_tag=previous_tag_name
-                )
-                # self.save_document(content, f"generated_docs/{report_name}.html")
-                html_file = self.save_document(content, f"{report_name}.html")
-
-                # Generate corresponding PDF file
-                self.generate_pdf(html_file)
-
-            # Verify files were created
-            files = list(Path(self.output_dir).glob('*.html'))
-            logger.info(f"Generated {len(files)} files: {[f.name for f in files]}")
+            # PDF conversions wait on wkhtmltopdf, they run in threads while the
+            # remaining reports and the email are rendered
+            pdf_reports = [name for name in self.reports if 'pdf' in self.report_formats[name]]
+            with ThreadPoolExecutor(max_workers=max(len(pdf_reports), 1)) as pdf_pool:
+                pdf_jobs = []
+                # Artefacts of the selected formats, intermediate HTML of PDF-only reports excluded
+                files = []
+                for report_name, output_file in self.render_documents(
+                    categorized, current_tag_name, previous_tag_name, len(commits)
+                ):
+                    if report_name not in pdf_reports or 'html' in self.report_formats[report_name]:
+                        files.append(output_file)
+                    if report_name in pdf_reports:
+                        pdf_jobs.append(pdf_pool.submit(self._timed_pdf, report_name, output_file))
+
+                if self.email_enabled:
+                    with self.metrics.timer("email"):
+                        self.render_email(categorized, current_tag_name)
+
+                for job in pdf_jobs:
+                    files.append(job.result())
+
+            logger.info(f"Generated {len(files)} files: {[os.path.basename(f) for f in files]}")
 
         except Exception as e:
             logger.error(f"❌ Error generating documents: {e}")
             raise
+        finally:
+            # Written on failures too, a slow or failing run is when they matter
+            self.metrics.write_json(self.metrics_path)
+            self.metrics.write_step_summary()
+
+    def resolve_tickets(self, categorized: Dict) -> None:
+        """Resolve every unique ref of the run once and attach the tickets to their commits"""
+        identities = categorized.identities
+        commits_by_ref = identities.commits_by_ref
+        # The tracker is asked for the IDs as written, the tickets are keyed by the index key
+        found = self.ticket_resolver.resolve(identities.ref_ids.values())
+        categorized.tickets = {
+            key: found[ref_id] for key, ref_id in identities.ref_ids.items() if ref_id in found
+        }
+        for ref_id, ticket in categorized.tickets.items():
+            for commit in commits_by_ref[ref_id]:
+                commit.setdefault('tickets', {})[ref_id] = ticket
+
+    def render_documents(
+        self,
+        categorized: Dict,
+        current_tag: Optional[str],
+        previous_tag: Optional[str],
+        commit_count: int
+    ) -> Iterable[Tuple[str, str]]:
+        """Render the selected reports, yields (report name, file) as each one is written.
+
+        The generators are CPU bound: large ranges with several reports render
+        them in separate processes, otherwise they are rendered inline.
+        """
+        # Only the selected generators are imported and built
+        generators = {
+            report_name: ReportGeneratorFactory.create_generator(report_type)
+            for report_name, report_type in self.reports.items()
+        }
+        workers = min(MAX_WORKERS, len(generators))
+
+        if workers < 2 or commit_count < PARALLEL_MIN_COMMITS:
+            for report_name, generator in generators.items():
+                with self.metrics.timer(f"render {report_name}") as stage:
+                    # Stream content to disk as it is generated
+                    output_file = self.save_document(
+                        generator.stream(
+                            commits=categorized,
+                            current_tag=current_tag,
+                            previous_tag=previous_tag
+                        ),
+                        f"{report_name}.{generator.file_extension}"
+                    )
+                    stage["bytes"] = os.path.getsize(output_file)
+                yield report_name, output_file
+            return
+
+        # Forked workers share the categorized commits without pickling them
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_render_worker,
+            initargs=(categorized, current_tag, previous_tag)
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _render_report,
+                    self.reports[report_name],
+                    self.document_path(f"{report_name}.{generator.file_extension}")
+                ): report_name
+                for report_name, generator in generators.items()
+            }
+            for future in as_completed(futures):
+                report_name = futures[future]
+                output_file, seconds = future.result()
+                logger.info(f"✅ Generated {output_file}")
+                self.metrics.record_stage(f"render {report_name}", seconds,
+                                          bytes=os.path.getsize(output_file), worker="process")
+                yield report_name, output_file
+
+    def _timed_pdf(self, report_name: str, html_file: str) -> str:
+        """Convert a report to PDF, the HTML is removed when only the PDF was selected"""
+        with self.metrics.timer(f"pdf {report_name}"):
+            self.generate_pdf(html_file)
+        if 'html' not in self.report_formats[report_name]:
+            os.remove(html_file)
+        return os.path.splitext(html_file)[0] + '.pdf'
+
+    def render_email(self, categorized: Dict, tag_name: Optional[str] = None) -> str:
+        """Render the release email with an inline summary of the categorized commits"""
+        from automatic_email.email_renderer import (
+            DEFAULT_TEMPLATE_PATH, build_context, render_email, render_release_summary
+        )
 
-    def save_document(self, content: str, base_filename: str):
-        """Save HTML content to a file and return the file path."""
-        filename = os.path.join(self.output_dir,
-                                f"{os.path.splitext(base_filename)[0]}_{datetime.now().strftime('%Y-%m-%d')}.html")
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # Counts come from the categorize pass, only the listed commits are walked
+        stats = commit_stats(categorized)
+        type_counts = []
+        top_items = []
+        for type_name in StyleConfig.PRIORITY_ORDER:
+            count = stats.types[type_name]
+            if not count:
+                continue
 
-        with open(filename, 'w', encoding='utf-8') as file:
-            file.write(content)
+            emoji = StyleConfig.TYPE_STYLES[type_name]["emoji"]
+            type_counts.append((f"{emoji} {type_name.capitalize()}s", count))
+            for scope, commits in categorized.get(type_name, {}).items():
+                if len(top_items) >= self.EMAIL_TOP_ITEMS:
+                    break
+                top_items.extend(f"{scope}: {commit['title']}" for commit in commits)
+        top_items = top_items[:self.EMAIL_TOP_ITEMS]
 
+        context = build_context(
+            os.getenv('REPO_NAME', 'Unknown Repository'),
+            os.getenv('TAG_NAME') or tag_name or 'Unknown Tag',
+            releaseSummary=render_release_summary(type_counts, top_items)
+        )
+        output_path = os.getenv(
+            'EMAIL_OUTPUT_PATH',
+            os.path.join(self.workspace_root, '.github', 'scripts', 'automatic_email', 'email_output.html')
+        )
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        render_email(DEFAULT_TEMPLATE_PATH, output_path, context)
+        logger.info(f"✅ Generated email: {output_path}")
+
+        # Small patches are summarised inline, the workflow then skips the attachments
+        total = sum(count for _, count in type_counts)
+        min_commits = int(os.getenv('EMAIL_ATTACHMENT_MIN_COMMITS', '0'))
+        self._set_step_output('attach_files', 'true' if total >= min_commits else 'false')
+        return output_path
+
+    def _set_step_output(self, name: str, value: str) -> None:
+        """Expose a value to later GitHub Actions steps"""
+        output_file = os.getenv('GITHUB_OUTPUT')
+        if not output_file:
+            return
+        with open(output_file, 'a', encoding='utf-8') as file:
+            file.write(f"{name}={value}\n")
+
+    def document_path(self, base_filename: str) -> str:
+        """Dated path of a generated document in the output directory"""
+        name, extension = os.path.splitext(base_filename)
+        return os.path.join(self.output_dir,
+                            f"{name}_{datetime.now().strftime('%Y-%m-%d')}{extension or '.html'}")
+
+    def save_document(self, content: Union[str, Iterable[str]], base_filename: str):
+        """Save content, or an iterable of content chunks, to a file and return the file path."""
+        filename = write_document([content] if isinstance(content, str) else content,
+                                  self.document_path(base_filename))
         logger.info(f"✅ Generated {filename}")
         return filename
 
@@ -94,6 +370,9 @@ class EnhancedCommitDocumentManager(CommitDocumentManager):
     def generate_pdf(self, html_file: str):
         """Generate a PDF from the given HTML file using pdfkit."""
         try:
+            # Deferred, pdfkit is only needed when a PDF is actually produced
+            import pdfkit
+
             pdf_file = os.path.splitext(html_file)[0] + '.pdf'
             pdfkit.from_file(html_file, pdf_file)
             logger.info(f"✅ Generated PDF: {pdf_file}")
@@ -0,0 +1,135 @@
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# "Name <email>" pairs of a .mailmap line, the name may be empty
+MAILMAP_ENTRY = re.compile(r"\s*([^<]*?)\s*<([^>]*)>")
+
+# Comments start with '#' at the beginning of the line or after whitespace
+MAILMAP_COMMENT = re.compile(r"(?:^|\s)#.*$")
+
+
+class Mailmap:
+    """Lookup tables built from a git .mailmap file.
+
+    Supports the four .mailmap forms:
+        Proper Name <commit@email>
+        <proper@email> <commit@email>
+        Proper Name <proper@email> <commit@email>
+        Proper Name <proper@email> Commit Name <commit@email>
+    Emails are matched case-insensitively, names exactly, as git does.
+    """
+
+    def __init__(self, lines: Iterable[str] = ()):
+        # commit email -> (proper name, proper email), either may be None
+        self.by_email: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # (commit name, commit email) -> (proper name, proper email)
+        self.by_name_email: Dict[Tuple[str, str], Tuple[Optional[str], Optional[str]]] = {}
+        # proper email -> proper name, for unmapped spellings of a mapped identity
+        self.names: Dict[str, str] = {}
+        for line in lines:
+            self._add_line(line)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Mailmap":
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                mailmap = cls(file)
+        except OSError:
+            return cls()
+        logger.info(f"Loaded {len(mailmap)} mailmap entries from {path}")
+        return mailmap
+
+    def __len__(self) -> int:
+        return len(self.by_email) + len(self.by_name_email)
+
+    def _add_line(self, line: str) -> None:
+        entries = MAILMAP_ENTRY.findall(MAILMAP_COMMENT.sub('', line))
+        if not entries:
+            return
+
+        proper_name, proper_email = entries[0]
+        if len(entries) == 1:
+            # Proper Name <commit@email>
+            if proper_name:
+                self.by_email[proper_email.lower()] = (proper_name, None)
+                self.names[proper_email.lower()] = proper_name
+            return
+
+        commit_name, commit_email = entries[1]
+        proper = (proper_name or None, proper_email or None)
+        if proper_name and proper_email:
+            self.names.setdefault(proper_email.lower(), proper_name)
+        if commit_name:
+            self.by_name_email[(commit_name, commit_email.lower())] = proper
+        else:
+            self.by_email[commit_email.lower()] = proper
+
+    def lookup(self, name: str, email: str) -> Tuple[Optional[str], Optional[str]]:
+        """Proper (name, email) of an author, None where the mailmap does not say"""
+        key = email.lower()
+        return self.by_name_email.get((name, key)) or self.by_email.get(key) or (None, None)
+
+    def resolve(self, name: str, email: str) -> Tuple[str, str]:
+        """Canonical (name, email) of an author"""
+        proper_name, proper_email = self.lookup(name, email)
+        return proper_name or name, proper_email or email
+
+
+class IdentityIndex:
+    """Canonical authors and ref -> commits index, filled while categorizing.
+
+    Author identities are resolved once per distinct (name, email) pair, so
+    each commit costs a dict lookup; refs are indexed by their normalised ID
+    so per-author and per-ticket views are lookups instead of scans. The ID
+    as written is kept for the tracker, whose IDs may be case-sensitive.
+    """
+
+    def __init__(self, mailmap: Optional[Mailmap] = None):
+        self.mailmap = mailmap or Mailmap()
+        self._identities: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        # Canonical email (name when there is none) -> canonical name
+        self.authors: Dict[str, str] = {}
+        # Canonical author name -> commits
+        self.commits_by_author: Dict[str, List[Dict]] = {}
+        # Normalised ref ID -> commits referencing it
+        self.commits_by_ref: Dict[str, List[Dict]] = {}
+        # Normalised ref ID -> ID as first written, without its '#'
+        self.ref_ids: Dict[str, str] = {}
+
+    @staticmethod
+    def ref_id(ref: str) -> str:
+        """Ref ID without its leading '#': "#CU-86abc" -> "CU-86abc" """
+        return ref.strip().lstrip('#')
+
+    @classmethod
+    def normalise_ref(cls, ref: str) -> str:
+        """Ref ID upper-cased, the index key: "#cu-12" -> "CU-12" """
+        return cls.ref_id(ref).upper()
+
+    def identity(self, name: str, email: str = "") -> Tuple[str, str]:
+        """Canonical (name, email) of an author, memoised per spelling"""
+        key = (name, email)
+        identity = self._identities.get(key)
+        if identity is None:
+            proper_name, proper_email = self.mailmap.lookup(name, email)
+            email = proper_email or email
+            if proper_name:
+                name = proper_name
+            else:
+                # Unmapped spellings take the mailmap name of their email, or else
+                # the first spelling seen for it
+                name = self.mailmap.names.get(email.lower()) or \
+                    self.authors.setdefault(email.lower() or name, name)
+            identity = self._identities[key] = (name, email)
+        return identity
+
+    def add(self, commit: Dict) -> None:
+        """Index a categorized commit entry by its author and refs"""
+        self.commits_by_author.setdefault(commit['author'], []).append(commit)
+        for ref in commit['refs']:
+            key = self.normalise_ref(ref)
+            self.ref_ids.setdefault(key, self.ref_id(ref))
+            self.commits_by_ref.setdefault(key, []).append(commit)
@@ -1,20 +1,45 @@
 import os
 import logging
+import sys
 
-from commit_fetcher import GitHubCommitFetcher
-from basic_commit_parser import BasicCommitParser
-from enhanced_commit_document_manager import EnhancedCommitDocumentManager
 
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
-def main():
+def configure_logging():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+
+def generate_reports(github_token: str, repo_owner: str, repo_name: str):
+    # Heavy dependencies (requests, GitPython) are only imported once a run is certain
+    from .commit_fetcher import GitHubCommitFetcher
+    from .basic_commit_parser import BasicCommitParser
+    from .enhanced_commit_document_manager import EnhancedCommitDocumentManager
+
+    # Create components
+    commit_fetcher = GitHubCommitFetcher(github_token, repo_owner, repo_name)
+    commit_parser = BasicCommitParser()
+
+    # Create document manager and generate reports
+    document_manager = EnhancedCommitDocumentManager(commit_fetcher, commit_parser)
+    document_manager.generate_all_documents()
+
+
+def main(argv=None) -> int:
+    """Generate the reports, returns the exit status so a failed run stops the workflow"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the changelog reports of a release")
+    parser.add_argument("--profile", action="store_true",
+                        default=os.getenv('CHANGELOG_PROFILE', 'false').lower() == 'true',
+                        help="profile the run (cProfile and tracemalloc), reports go to generated_docs/")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+
     # Setup GitHub credentials
     github_token = os.getenv('GITHUB_TOKEN')
     repo_owner = os.getenv('REPO_OWNER')
@@ -22,20 +47,23 @@ def main():
 
     if not all([github_token, repo_owner, repo_name]):
         logger.error("Missing required environment variables")
-        return
+        return 1
 
     try:
-        # Create components
-        commit_fetcher = GitHubCommitFetcher(github_token, repo_owner, repo_name)
-        commit_parser = BasicCommitParser()
-
-        # Create document manager and generate reports
-        document_manager = EnhancedCommitDocumentManager(commit_fetcher, commit_parser)
-        document_manager.generate_all_documents()
-        
+        if args.profile:
+            from .profiling import profile_run
+
+            output_dir = os.path.join(os.getenv('GITHUB_WORKSPACE', os.getcwd()), 'generated_docs')
+            with profile_run(output_dir):
+                generate_reports(github_token, repo_owner, repo_name)
+        else:
+            generate_reports(github_token, repo_owner, repo_name)
+
         logger.info("✅ Successfully generated all reports")
+        return 0
     except Exception as e:
         logger.error(f"Error generating reports: {e}")
+        return 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
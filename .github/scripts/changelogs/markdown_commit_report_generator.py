@@ -1,5 +1,6 @@
 import os
-from base_report_strategy import BaseReportStrategy
+from .base_report_strategy import BaseReportStrategy
+from .identity_index import IdentityIndex
 from typing import Dict, Optional
 from datetime import datetime
 
@@ -30,7 +31,9 @@ class MarkdownCommitReportGenerator(BaseReportStrategy):
             ])
 
         if commit['refs']:
-            elements.append(f"<div class='commit-meta'>🔗 {', '.join(commit['refs'])}</div>")
+            tickets = commit.get('tickets', {})
+            refs = [self._format_ref(ref, tickets.get(IdentityIndex.normalise_ref(ref))) for ref in commit['refs']]
+            elements.append(f"<div class='commit-meta'>🔗 {', '.join(refs)}</div>")
 
         elements.append("</li>")
         return '\n'.join(elements)
@@ -68,8 +71,11 @@ class MarkdownCommitReportGenerator(BaseReportStrategy):
         if not has_commits:
             doc.append(self._generate_empty_state())
         else:
+            doc.append(self._generate_stats_section(commits))
             for type_name in self.PRIORITY_ORDER:
                 doc.append(self._generate_type_section(type_name, commits.get(type_name, {})))
+            doc.append(self._generate_refs_section(commits))
+            doc.append(self._generate_authors_section(commits))
 
         doc.append("</div>")
         doc.append("</body>")
@@ -0,0 +1,115 @@
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# GitHub rate-limit headers recorded for every API request
+RATE_LIMIT_HEADERS = {
+    "X-RateLimit-Limit": "rate_limit",
+    "X-RateLimit-Remaining": "rate_remaining",
+    "X-RateLimit-Used": "rate_used",
+    "X-RateLimit-Reset": "rate_reset"
+}
+
+
+class PipelineMetrics:
+    """Wall time of each changelog pipeline stage and of each GitHub API request"""
+
+    def __init__(self):
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self._start = time.perf_counter()
+        self.stages: List[Dict] = []
+        self.requests: List[Dict] = []
+
+    @contextmanager
+    def timer(self, stage: str, **details) -> Iterator[Dict]:
+        """Time a stage; the yielded dict can be filled with extra details"""
+        record = {"stage": stage, **details}
+        start = time.perf_counter()
+        try:
+            yield record
+            record["status"] = "ok"
+        except Exception as e:
+            record["status"] = f"error: {e}"
+            raise
+        finally:
+            record["seconds"] = round(time.perf_counter() - start, 4)
+            self.stages.append(record)
+            logger.debug(f"{stage} took {record['seconds']:.3f}s")
+
+    def record_stage(self, stage: str, seconds: float, **details) -> None:
+        """Record a stage timed elsewhere, e.g. in a worker process"""
+        self.stages.append({"stage": stage, **details, "status": "ok", "seconds": round(seconds, 4)})
+
+    def record_request(self, method: str, url: str, seconds: float, response=None, error: Optional[str] = None):
+        """Record an HTTP request with its status, size and rate-limit headers"""
+        record = {"method": method, "url": url, "seconds": round(seconds, 4)}
+        if response is not None:
+            record["status"] = response.status_code
+            record["bytes"] = len(response.content)
+            for header, key in RATE_LIMIT_HEADERS.items():
+                if header in response.headers:
+                    record[key] = int(response.headers[header])
+        if error:
+            record["error"] = error
+        self.requests.append(record)
+
+    def to_dict(self) -> Dict:
+        return {
+            "started_at": self.started_at,
+            "total_seconds": round(time.perf_counter() - self._start, 4),
+            "stages": self.stages,
+            "requests": self.requests,
+            "http": {
+                "count": len(self.requests),
+                "seconds": round(sum(r["seconds"] for r in self.requests), 4),
+                "bytes": sum(r.get("bytes", 0) for r in self.requests),
+                "rate_remaining": next(
+                    (r["rate_remaining"] for r in reversed(self.requests) if "rate_remaining" in r), None
+                )
+            }
+        }
+
+    def write_json(self, path: str) -> str:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=2)
+        logger.info(f"✅ Metrics written to {path}")
+        return path
+
+    def render_summary(self) -> str:
+        """Markdown summary table for the GitHub Actions step summary"""
+        data = self.to_dict()
+        lines = [
+            "### Changelog generation",
+            "",
+            "| Stage | Time (s) | Details |",
+            "|---|---:|---|"
+        ]
+        for stage in data["stages"]:
+            details = ", ".join(f"{k}={v}" for k, v in stage.items() if k not in ("stage", "seconds"))
+            lines.append(f"| {stage['stage']} | {stage['seconds']:.3f} | {details} |")
+
+        http = data["http"]
+        lines += [
+            "",
+            f"**GitHub API:** {http['count']} request(s), {http['seconds']:.3f}s, "
+            f"{http['bytes'] / 1024:.1f} KiB, rate limit remaining: {http['rate_remaining']}",
+            "",
+            f"**Total:** {data['total_seconds']:.3f}s",
+            ""
+        ]
+        return "\n".join(lines)
+
+    def write_step_summary(self) -> None:
+        """Append the summary table to $GITHUB_STEP_SUMMARY when running in Actions"""
+        summary_file = os.getenv('GITHUB_STEP_SUMMARY')
+        if not summary_file:
+            return
+        with open(summary_file, 'a', encoding='utf-8') as file:
+            file.write(self.render_summary())
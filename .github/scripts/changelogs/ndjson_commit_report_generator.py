@@ -0,0 +1,80 @@
+import json
+import os
+from .base_interfaces import ReportStrategy
+from .commit_stats import commit_identities, commit_stats
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional
+
+class NdjsonCommitReportGenerator(ReportStrategy):
+    """Machine-readable export of the categorised commits, one JSON record per line"""
+
+    file_extension = "ndjson"
+
+    def _encode(self, record: Dict) -> str:
+        """Serialize a single record as one NDJSON line"""
+        return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+    def _generate_report_record(
+            self,
+            current_tag: Optional[str] = None,
+            previous_tag: Optional[str] = None
+    ) -> Dict:
+        """Generate the leading record describing the run"""
+        return {
+            "record": "report",
+            "repository": f"{os.getenv('REPO_OWNER')}/{os.getenv('REPO_NAME')}",
+            "current_tag": current_tag,
+            "previous_tag": previous_tag,
+            "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        }
+
+    def _generate_commit_record(self, type_name: str, scope: str, commit: Dict) -> Dict:
+        """Generate the record for a single commit"""
+        return {
+            "record": "commit",
+            "type": type_name,
+            "scope": scope,
+            "sha": commit.get('sha', ''),
+            "date": commit.get('iso_date', ''),
+            "author": commit['author'],
+            "title": commit['title'],
+            "body": commit['body'],
+            "refs": commit['refs']
+        }
+
+    def stream(
+            self,
+            commits: Dict,
+            current_tag: Optional[str] = None,
+            previous_tag: Optional[str] = None
+    ) -> Iterator[str]:
+        yield self._encode(self._generate_report_record(current_tag, previous_tag))
+        # Aggregates up front, consumers needing only the summary can stop reading here
+        yield self._encode({"record": "stats", **commit_stats(commits).to_dict()})
+        tickets = getattr(commits, 'tickets', {})
+        ref_ids = commit_identities(commits).ref_ids if tickets else {}
+        for ticket_id, ticket in tickets.items():
+            # Tracker fields must not override the record type and ID, the ID is kept as written
+            yield self._encode({**ticket, "record": "ticket", "id": ref_ids.get(ticket_id, ticket_id)})
+
+        type_counts = {}
+        for type_name, commits_by_scope in commits.items():
+            for scope, scope_commits in commits_by_scope.items():
+                for commit in scope_commits:
+                    yield self._encode(self._generate_commit_record(type_name, scope, commit))
+                type_counts[type_name] = type_counts.get(type_name, 0) + len(scope_commits)
+
+        # Trailing record lets consumers check they read the whole stream
+        yield self._encode({
+            "record": "summary",
+            "total": sum(type_counts.values()),
+            "types": type_counts
+        })
+
+    def generate(
+            self,
+            commits: Dict,
+            current_tag: Optional[str] = None,
+            previous_tag: Optional[str] = None
+    ) -> str:
+        return ''.join(self.stream(commits, current_tag, previous_tag))
@@ -0,0 +1,58 @@
+import cProfile
+import logging
+import os
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+# Entries written to the text reports
+PROFILE_TOP_FUNCTIONS = 40
+PROFILE_TOP_ALLOCATIONS = 25
+
+# Frames kept per allocation, enough to see which generator or parser allocated
+TRACEMALLOC_FRAMES = 10
+
+
+@contextmanager
+def profile_run(output_dir: str, name: str = 'changelog_profile') -> Iterator[None]:
+    """Run the block under cProfile and tracemalloc and write the reports to output_dir.
+
+    Writes <name>.prof (load it with snakeviz or pstats), <name>.txt (top
+    functions by cumulative time) and <name>_allocations.txt (peak memory and
+    top allocation sites), also when the block raises.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    profiler = cProfile.Profile()
+    tracemalloc.start(TRACEMALLOC_FRAMES)
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        prof_file = os.path.join(output_dir, f"{name}.prof")
+        profiler.dump_stats(prof_file)
+        with open(os.path.join(output_dir, f"{name}.txt"), 'w', encoding='utf-8') as file:
+            stats = pstats.Stats(profiler, stream=file)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_FUNCTIONS)
+
+        allocations_file = os.path.join(output_dir, f"{name}_allocations.txt")
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>")
+        ])
+        with open(allocations_file, 'w', encoding='utf-8') as file:
+            file.write(f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB\n")
+            file.write(f"Still allocated at the end: {current / 1024 / 1024:.1f} MiB\n\n")
+            file.write(f"Top {PROFILE_TOP_ALLOCATIONS} allocation sites:\n")
+            for stat in snapshot.statistics('traceback')[:PROFILE_TOP_ALLOCATIONS]:
+                file.write(f"\n{stat.size / 1024:.1f} KiB in {stat.count} blocks\n")
+                file.write("\n".join(stat.traceback.format(limit=TRACEMALLOC_FRAMES)) + "\n")
+
+        logger.info(f"✅ Profile written to {prof_file} (peak memory {peak / 1024 / 1024:.1f} MiB)")
@@ -0,0 +1,102 @@
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Message written by `git revert`
+REVERT_TITLE_PATTERN = re.compile(r'^Revert "(?P<header>.+)"\s*$')
+REVERT_SHA_PATTERN = re.compile(r"This reverts commit (?P<sha>[0-9a-fA-F]{7,40})")
+
+# Abbreviated SHAs in revert messages are matched on this many characters
+SHORT_SHA_LENGTH = 7
+
+
+def _header(commit: Dict) -> str:
+    return commit["commit"]["message"].strip().split('\n', 1)[0].strip()
+
+
+def _parents(commit: Dict, parents_lookup: Optional[Callable[[str], List[str]]]) -> List[str]:
+    """Parent SHAs from the API payload, or from local git when the payload has none"""
+    if "parents" in commit:
+        return [parent["sha"] for parent in commit["parents"]]
+    if parents_lookup and commit.get("sha"):
+        try:
+            return parents_lookup(commit["sha"])
+        except Exception:
+            return []
+    return []
+
+
+def fold_commits(
+    commits: List[Dict],
+    parents_lookup: Optional[Callable[[str], List[str]]] = None,
+    newest_first: bool = False
+) -> Tuple[List[Dict], Dict[str, int]]:
+    """Drop the net-zero changes of a range before it is categorized.
+
+    - a revert and the commit it reverts cancel out when both are in the
+      range; a reverted revert brings its original back. The reverted
+      commit is found from "This reverts commit <sha>", or from the
+      quoted header when the message names no SHA. A revert naming a SHA
+      outside the range is kept as is, its header may match a later
+      re-application of the same change.
+    - a merge commit is dropped when the commits of its merged branch are
+      in the range, they already carry the content.
+
+    Commits are oldest first as returned by the compare API, newest_first
+    for the commit listing API. Returns the kept commits, in the given
+    order, and the number of commits folded per reason.
+    """
+    if newest_first:
+        kept, counts = fold_commits(commits[::-1], parents_lookup)
+        return kept[::-1], counts
+
+    position: Dict[str, int] = {}
+    short_position: Dict[str, int] = {}
+    header_positions: Dict[str, List[int]] = {}
+    for index, commit in enumerate(commits):
+        sha = commit.get("sha", "")
+        if sha:
+            position[sha] = index
+            short_position[sha[:SHORT_SHA_LENGTH]] = index
+        header_positions.setdefault(_header(commit), []).append(index)
+
+    folded: Dict[int, str] = {}
+
+    # Newest first: a revert that is itself reverted is cancelled before it can cancel its target
+    for index in range(len(commits) - 1, -1, -1):
+        if index in folded:
+            continue
+        commit = commits[index]
+        message = commit["commit"]["message"]
+        title = REVERT_TITLE_PATTERN.match(_header(commit))
+        sha_match = REVERT_SHA_PATTERN.search(message)
+        if not title and not sha_match:
+            continue
+
+        target = None
+        if sha_match:
+            sha = sha_match.group("sha").lower()
+            target = position.get(sha)
+            if target is None:
+                target = short_position.get(sha[:SHORT_SHA_LENGTH])
+        elif title:
+            # Latest earlier commit with the reverted header
+            candidates = [i for i in header_positions.get(title.group("header"), ()) if i < index]
+            target = candidates[-1] if candidates else None
+
+        if target is not None and target < index and target not in folded:
+            folded[target] = "reverted"
+            folded[index] = "reverts"
+
+    for index, commit in enumerate(commits):
+        if index in folded:
+            continue
+        parents = _parents(commit, parents_lookup)
+        # The first parent is the target branch, the others were merged in
+        if len(parents) > 1 and any(parent in position for parent in parents[1:]):
+            folded[index] = "merges"
+
+    counts = {"reverted": 0, "reverts": 0, "merges": 0}
+    for reason in folded.values():
+        counts[reason] += 1
+    kept = [commit for index, commit in enumerate(commits) if index not in folded]
+    return kept, counts
@@ -0,0 +1,188 @@
+import atexit
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Requests kept in reserve; below it only conditional requests go out before the reset
+RATE_LIMIT_RESERVE = int(os.getenv('GITHUB_API_RESERVE', '50'))
+
+# Spacing between requests, GitHub's secondary limit is 900 REST points per minute
+MIN_REQUEST_INTERVAL = float(os.getenv('GITHUB_API_MIN_INTERVAL', '0.07'))
+
+# Longest pause before giving up, the primary limit resets every hour
+MAX_WAIT = float(os.getenv('GITHUB_API_MAX_WAIT', '3700'))
+
+# Retries of a request rejected by a rate limit
+MAX_RETRIES = 3
+
+# First back-off of a secondary rate limit without Retry-After, GitHub asks for at least a minute
+SECONDARY_BACKOFF = 60.0
+
+
+class RateLimitExceeded(RuntimeError):
+    """The quota is exhausted and the reset is further away than the allowed wait"""
+
+    def __init__(self, resume_at: float):
+        super().__init__(f"GitHub API rate limit exhausted until {time.ctime(resume_at)}")
+        self.resume_at = resume_at
+
+
+class CachedResponse:
+    """Stands in for a requests.Response answered from the ETag cache (HTTP 304)"""
+
+    status_code = 200
+
+    def __init__(self, data: Any, headers: Dict[str, str]):
+        self._data = data
+        self.headers = headers
+        self.content = json.dumps(data).encode('utf-8')
+
+    def json(self) -> Any:
+        return self._data
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class RateLimitBudget:
+    """GitHub API quota shared by every request made with the same token.
+
+    The remaining quota and reset time are read from each response. Requests
+    are spaced to stay under the secondary limits. When the quota runs low,
+    requests that have a cached ETag can still be sent, because a 304 answer
+    does not count against the limit. Other requests wait for the reset
+    instead of failing. A run killed during a pause can resume from the
+    persisted ETag cache (cache_path) without spending its quota again.
+    """
+
+    def __init__(
+        self,
+        reserve: int = RATE_LIMIT_RESERVE,
+        min_interval: float = MIN_REQUEST_INTERVAL,
+        max_wait: float = MAX_WAIT,
+        max_retries: int = MAX_RETRIES,
+        cache_path: Optional[str] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time
+    ):
+        self.reserve = reserve
+        self.min_interval = min_interval
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self.cache_path = cache_path
+        self._sleep = sleep
+        self._clock = clock
+
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.paused_seconds = 0.0
+        self._last_request = 0.0
+
+        # Cache key -> {"etag": ..., "data": ...}
+        self._cache: Dict[str, Dict] = {}
+        self._dirty = False
+        if cache_path:
+            self._load()
+            atexit.register(self.save)
+
+    @staticmethod
+    def cache_key(url: str, params: Optional[Dict] = None) -> str:
+        if not params:
+            return url
+        return url + '?' + '&'.join(f"{key}={params[key]}" for key in sorted(params))
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        entry = self._cache.get(key)
+        return {"If-None-Match": entry["etag"]} if entry else {}
+
+    def acquire(self, conditional: bool = False) -> None:
+        """Wait until a request may be sent"""
+        now = self._clock()
+        wait = self._last_request + self.min_interval - now
+
+        exhausted = self.remaining is not None and self.remaining <= (0 if conditional else self.reserve)
+        if exhausted and self.reset_at and self.reset_at > now:
+            wait = max(wait, self.reset_at - now + 1)
+            if wait > self.max_wait:
+                self.save()
+                raise RateLimitExceeded(self.reset_at)
+            logger.warning(f"GitHub API quota low ({self.remaining}/{self.limit}), pausing {wait:.0f}s until reset")
+            # Keep what was fetched so far if the job is cancelled during the pause
+            self.save()
+
+        if wait > 0:
+            self.pause(wait)
+        self._last_request = self._clock()
+
+    def pause(self, seconds: float) -> None:
+        self.paused_seconds += seconds
+        self._sleep(seconds)
+
+    def update(self, response) -> None:
+        """Read the quota from the rate-limit headers of a response"""
+        headers = response.headers
+        if "X-RateLimit-Remaining" in headers:
+            self.remaining = int(headers["X-RateLimit-Remaining"])
+        if "X-RateLimit-Limit" in headers:
+            self.limit = int(headers["X-RateLimit-Limit"])
+        if "X-RateLimit-Reset" in headers:
+            self.reset_at = float(headers["X-RateLimit-Reset"])
+
+    def retry_delay(self, response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, None if it must not be retried.
+
+        Raises RateLimitExceeded when the wait is longer than max_wait, as acquire does.
+        """
+        if response.status_code not in (403, 429) or attempt >= self.max_retries:
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            delay = float(retry_after)
+        elif response.headers.get("X-RateLimit-Remaining") == "0" and self.reset_at:
+            delay = max(self.reset_at - self._clock(), 0) + 1
+        elif "secondary rate limit" in getattr(response, 'text', '').lower():
+            delay = SECONDARY_BACKOFF * 2 ** attempt
+        else:
+            # A plain 403 (permissions, missing repository) is not retried
+            return None
+
+        if delay > self.max_wait:
+            self.save()
+            raise RateLimitExceeded(self._clock() + delay)
+        return delay
+
+    def resolve(self, key: str, response):
+        """Answer a 304 from the cache and remember the ETag of a fresh 200"""
+        if response.status_code == 304 and key in self._cache:
+            return CachedResponse(self._cache[key]["data"], dict(response.headers))
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            self._cache[key] = {"etag": etag, "data": response.json()}
+            self._dirty = True
+        return response
+
+    def _load(self) -> None:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as file:
+                self._cache = json.load(file)
+            logger.info(f"Loaded {len(self._cache)} cached GitHub API responses")
+        except (OSError, ValueError):
+            self._cache = {}
+
+    def save(self) -> None:
+        """Persist the ETag cache so a later run can resume with conditional requests"""
+        if not self.cache_path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+        tmp_file = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            json.dump(self._cache, file)
+        os.replace(tmp_file, self.cache_path)
+        self._dirty = False
@@ -1,4 +1,4 @@
-from base_report_strategy import BaseReportStrategy
+from .base_report_strategy import BaseReportStrategy
 from datetime import datetime
 from typing import Dict, Optional
 
@@ -58,6 +58,7 @@ class ReleaseChangelogReportGenerator(BaseReportStrategy):
         if not has_commits:
             doc.append(self._generate_empty_state())
         else:
+            doc.append(self._generate_stats_section(commits))
             for type_name in self.PRIORITY_ORDER:
                 doc.append(self._generate_type_section(
                     type_name,
@@ -1,12 +1,39 @@
-from markdown_commit_report_generator import MarkdownCommitReportGenerator
-from release_changelog_report_generator import ReleaseChangelogReportGenerator
-from base_interfaces import ReportStrategy
+import importlib
+from .base_interfaces import ReportStrategy
+from typing import Dict, List, Optional, Tuple
 
 class ReportGeneratorFactory:
-    @staticmethod
-    def create_generator(report_type: str) -> ReportStrategy:
-        generators = {
-            'release': ReleaseChangelogReportGenerator(),
-            'markdown': MarkdownCommitReportGenerator()
-        }
-        return generators.get(report_type)
+    # Report type -> (module, class); modules are only imported when first requested,
+    # relative module names are resolved inside this package
+    _registry: Dict[str, Tuple[str, str]] = {
+        'release': ('.release_changelog_report_generator', 'ReleaseChangelogReportGenerator'),
+        'markdown': ('.markdown_commit_report_generator', 'MarkdownCommitReportGenerator'),
+        'ndjson': ('.ndjson_commit_report_generator', 'NdjsonCommitReportGenerator')
+    }
+
+    # Generators are stateless, so one shared instance per type is enough
+    _instances: Dict[str, ReportStrategy] = {}
+
+    @classmethod
+    def register(cls, report_type: str, module_name: str, class_name: str) -> None:
+        """Register a generator without importing it"""
+        cls._registry[report_type] = (module_name, class_name)
+        cls._instances.pop(report_type, None)
+
+    @classmethod
+    def available_types(cls) -> List[str]:
+        return list(cls._registry)
+
+    @classmethod
+    def create_generator(cls, report_type: str) -> Optional[ReportStrategy]:
+        if report_type in cls._instances:
+            return cls._instances[report_type]
+
+        entry = cls._registry.get(report_type)
+        if entry is None:
+            return None
+
+        module_name, class_name = entry
+        generator_class = getattr(importlib.import_module(module_name, __package__), class_name)
+        generator = cls._instances[report_type] = generator_class()
+        return generator
@@ -0,0 +1,107 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance between two strings"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree over scope names for "did you mean" suggestions.
+
+    Nodes are stored as [word, {distance: child}] lists so the whole tree
+    can be written to the marshal scope cache and loaded back as-is.
+    """
+
+    def __init__(self, root: Optional[list] = None):
+        self.root = root
+
+    @classmethod
+    def build(cls, words: Iterable[str]) -> "BKTree":
+        tree = cls()
+        for word in words:
+            tree.add(word)
+        return tree
+
+    def add(self, word: str) -> None:
+        if self.root is None:
+            self.root = [word, {}]
+            return
+
+        node = self.root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [word, {}]
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Words within max_distance of word, closest first"""
+        if self.root is None:
+            return []
+
+        matches = []
+        stack = [self.root]
+        while stack:
+            candidate, children = stack.pop()
+            distance = levenshtein(word, candidate)
+            if distance <= max_distance:
+                matches.append((distance, candidate))
+            # Triangle inequality: only children in [d - max, d + max] can match
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return sorted(matches)
+
+
+class ScopeIndex:
+    """Hashed scope lookup with per-repository case rules and suggestions"""
+
+    def __init__(self, scopes: Iterable[str], case_sensitive: bool = True, tree: Optional[BKTree] = None):
+        scopes = list(scopes)
+        self.case_sensitive = case_sensitive
+        self.scopes = frozenset(self.normalise(scope) for scope in scopes)
+
+        # Lower-cased scope -> spellings from scopes.sh, suggestions ignore case
+        self.spellings: Dict[str, List[str]] = {}
+        for scope in scopes:
+            spellings = self.spellings.setdefault(scope.lower(), [])
+            if scope not in spellings:
+                spellings.append(scope)
+        self.tree = tree or BKTree.build(self.spellings)
+
+    def normalise(self, scope: str) -> str:
+        return scope if self.case_sensitive else scope.lower()
+
+    def __contains__(self, scope: str) -> bool:
+        return self.normalise(scope) in self.scopes
+
+    def __len__(self) -> int:
+        return len(self.scopes)
+
+    def suggest(self, scope: str, limit: int = 3) -> List[str]:
+        """Closest known scopes, including the same scope written in another case"""
+        word = scope.lower()
+        # Allow roughly one typo per three characters
+        max_distance = max(2, len(word) // 3)
+
+        suggestions = []
+        for _, key in self.tree.search(word, max_distance):
+            suggestions.extend(self.spellings[key])
+        return suggestions[:limit]
@@ -269,6 +269,70 @@ summary::-webkit-details-marker {
     color: var(--color-text-secondary);
 }
 
+/* Summary header */
+.stats {
+    margin-bottom: 2rem;
+}
+
+.stats-grid {
+    display: flex;
+    gap: 1rem;
+    margin-bottom: 1rem;
+}
+
+.stat-card {
+    flex: 1;
+    padding: 1rem;
+    text-align: center;
+    background: var(--color-surface);
+    border: 1px solid var(--color-border);
+    border-radius: var(--radius-base);
+    box-shadow: var(--shadow-sm);
+}
+
+.stat-value {
+    font-size: 1.5rem;
+    font-weight: 700;
+}
+
+.stat-label, .stats-authors {
+    color: var(--color-text-secondary);
+    font-size: 0.9rem;
+}
+
+.stats-types {
+    margin-bottom: 1rem;
+}
+
+.stat-type {
+    display: inline-block;
+    margin: 0 0.5rem 0.5rem 0;
+    padding: 0.2rem 0.75rem;
+    border-radius: var(--radius-base);
+    color: white;
+    font-size: 0.9rem;
+}
+
+.stats-table {
+    width: 100%;
+    border-collapse: collapse;
+    margin-bottom: 0.75rem;
+    font-size: 0.9rem;
+}
+
+.stats-table th, .stats-table td {
+    padding: 0.4rem 0.75rem;
+    text-align: left;
+    border-bottom: 1px solid var(--color-border);
+}
+
+.ticket-status {
+    padding: 0 0.4rem;
+    border-radius: var(--radius-base);
+    background: var(--color-elevated);
+    font-size: 0.8rem;
+}
+
 /* Print-specific adjustments */
 @media print {
     .scope-tag, .commit-title {
@@ -0,0 +1,194 @@
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .metrics import PipelineMetrics
+
+logger = logging.getLogger(__name__)
+
+# Refs looked up per tracker call
+TICKET_BATCH_SIZE = int(os.getenv('CHANGELOG_TICKET_BATCH_SIZE', '25'))
+
+# Hours a resolved (or unknown) ticket is served from the cache
+TICKET_CACHE_TTL_HOURS = float(os.getenv('CHANGELOG_TICKET_TTL_HOURS', '24'))
+
+# Seconds before a tracker request is abandoned, an unresolved ref is rendered bare
+TRACKER_TIMEOUT = 10
+
+
+class TrackerClient(ABC):
+    """Looks tickets up in an issue tracker, a batch of IDs at a time"""
+
+    @abstractmethod
+    def fetch_tickets(self, ticket_ids: List[str]) -> Dict[str, Dict]:
+        """Ticket ID -> {"title", "status", "url"}; unknown IDs are left out"""
+        pass
+
+
+class FileTrackerClient(TrackerClient):
+    """Serves tickets from a local JSON file ({"CU-1": {"title": ...}}), for tests and offline runs.
+
+    IDs are matched in any case.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'r', encoding='utf-8') as file:
+            self.tickets = {ticket_id.upper(): ticket for ticket_id, ticket in json.load(file).items()}
+        self.calls = 0
+
+    def fetch_tickets(self, ticket_ids: List[str]) -> Dict[str, Dict]:
+        self.calls += 1
+        return {ticket_id: self.tickets[ticket_id.upper()] for ticket_id in ticket_ids
+                if ticket_id.upper() in self.tickets}
+
+
+class ClickUpTrackerClient(TrackerClient):
+    """ClickUp tasks referenced as #CU-<task id>, the ClickUp GitHub integration convention.
+
+    ClickUp has no endpoint returning several tasks by ID, so a batch is
+    fetched with concurrent requests over one keep-alive session. The prefix
+    is matched in any case, the task ID is sent as written.
+    """
+
+    API_URL = "https://api.clickup.com/api/v2/task/{task_id}"
+    TASK_URL = "https://app.clickup.com/t/{task_id}"
+    PREFIX = "CU-"
+
+    def __init__(self, api_token: str, concurrency: int = 8, metrics: Optional[PipelineMetrics] = None):
+        import requests
+
+        self.session = requests.Session()
+        self.session.headers.update({"Authorization": api_token})
+        self.concurrency = concurrency
+        self.metrics = metrics or PipelineMetrics()
+
+    def _fetch_task(self, ticket_id: str) -> Optional[Dict]:
+        task_id = ticket_id[len(self.PREFIX):]
+        url = self.API_URL.format(task_id=task_id)
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=TRACKER_TIMEOUT)
+        except Exception as e:
+            self.metrics.record_request("GET", url, time.perf_counter() - start, error=str(e))
+            logger.warning(f"Could not resolve {ticket_id}: {e}")
+            return None
+        self.metrics.record_request("GET", url, time.perf_counter() - start, response)
+        if response.status_code != 200:
+            logger.debug(f"{ticket_id} not found (HTTP {response.status_code})")
+            return None
+
+        task = response.json()
+        return {
+            "title": task.get("name", ""),
+            "status": (task.get("status") or {}).get("status", ""),
+            "url": task.get("url") or self.TASK_URL.format(task_id=task_id)
+        }
+
+    def fetch_tickets(self, ticket_ids: List[str]) -> Dict[str, Dict]:
+        ticket_ids = [ticket_id for ticket_id in ticket_ids if ticket_id[:len(self.PREFIX)].upper() == self.PREFIX]
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(ticket_ids)))) as pool:
+            tickets = dict(zip(ticket_ids, pool.map(self._fetch_task, ticket_ids)))
+        return {ticket_id: ticket for ticket_id, ticket in tickets.items() if ticket}
+
+
+class TicketCache:
+    """Resolved tickets persisted in a JSON file, each entry valid for ttl seconds.
+
+    Unknown tickets are cached as None as well, so a typo in a ref is not
+    looked up again on every run.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = TICKET_CACHE_TTL_HOURS * 3600,
+                 clock: Callable[[], float] = time.time):
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+        # Ticket ID -> {"fetched_at": ..., "ticket": ... or None}
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+        if path:
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    self._entries = json.load(file)
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def get(self, ticket_id: str):
+        """Cached ticket, None for a known miss, KeyError when absent or expired"""
+        entry = self._entries[ticket_id]
+        if self._clock() - entry["fetched_at"] > self.ttl:
+            raise KeyError(ticket_id)
+        return entry["ticket"]
+
+    def put(self, ticket_id: str, ticket: Optional[Dict]) -> None:
+        self._entries[ticket_id] = {"fetched_at": self._clock(), "ticket": ticket}
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        now = self._clock()
+        entries = {key: entry for key, entry in self._entries.items() if now - entry["fetched_at"] <= self.ttl}
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_file = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            json.dump(entries, file)
+        os.replace(tmp_file, self.path)
+        self._dirty = False
+
+
+class TicketResolver:
+    """Resolves the unique refs of a run, from the cache first and the tracker in batches"""
+
+    def __init__(self, client: TrackerClient, cache: Optional[TicketCache] = None,
+                 batch_size: int = TICKET_BATCH_SIZE):
+        self.client = client
+        self.cache = cache or TicketCache()
+        self.batch_size = batch_size
+
+    def resolve(self, ticket_ids: Iterable[str]) -> Dict[str, Dict]:
+        """Ticket ID -> ticket for the IDs the tracker knows"""
+        tickets: Dict[str, Dict] = {}
+        missing = []
+        for ticket_id in dict.fromkeys(ticket_ids):
+            try:
+                ticket = self.cache.get(ticket_id)
+            except KeyError:
+                missing.append(ticket_id)
+                continue
+            if ticket:
+                tickets[ticket_id] = ticket
+
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            try:
+                found = self.client.fetch_tickets(batch)
+            except Exception as e:
+                # Tickets are an enrichment, the reports still render with bare refs
+                logger.warning(f"Could not resolve tickets {batch[0]}..{batch[-1]}: {e}")
+                continue
+            for ticket_id in batch:
+                self.cache.put(ticket_id, found.get(ticket_id))
+            tickets.update(found)
+
+        self.cache.save()
+        logger.info(f"Resolved {len(tickets)} ticket(s), {len(missing)} looked up in the tracker")
+        return tickets
+
+
+def create_ticket_resolver(metrics: Optional[PipelineMetrics] = None) -> Optional[TicketResolver]:
+    """Resolver configured from the environment, None when no tracker is set up"""
+    tracker = os.getenv('CHANGELOG_TRACKER', '').lower()
+    if tracker == 'clickup' and os.getenv('CLICKUP_API_TOKEN'):
+        client = ClickUpTrackerClient(os.getenv('CLICKUP_API_TOKEN'), metrics=metrics)
+    elif tracker == 'file' and os.getenv('CHANGELOG_TRACKER_FILE'):
+        client = FileTrackerClient(os.getenv('CHANGELOG_TRACKER_FILE'))
+    else:
+        if tracker:
+            logger.warning(f"Ticket tracker '{tracker}' is not configured, refs are rendered as is")
+        return None
+    return TicketResolver(client, TicketCache(os.getenv('CHANGELOG_TICKET_CACHE_PATH')))
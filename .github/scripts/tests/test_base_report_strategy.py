@@ -0,0 +1,19 @@
+from changelogs.markdown_commit_report_generator import MarkdownCommitReportGenerator
+
+
+def test_ticket_fields_are_escaped():
+    ticket = {"title": "<script>alert(1)</script>", "status": "<b>done</b>", "url": "https://x.io/t?a=1&b='2'"}
+    rendered = MarkdownCommitReportGenerator()._format_ref("#CU-1", ticket)
+
+    assert "<script>" not in rendered and "<b>" not in rendered
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in rendered
+    assert 'href="https://x.io/t?a=1&amp;b=&#x27;2&#x27;"' in rendered
+
+
+def test_non_http_ticket_urls_are_not_linked():
+    rendered = MarkdownCommitReportGenerator()._format_ref("#CU-1", {"title": "T", "url": "javascript:alert(1)"})
+    assert rendered == "#CU-1 T"
+
+
+def test_unresolved_refs_are_rendered_as_is():
+    assert MarkdownCommitReportGenerator()._format_ref("#CU-1", None) == "#CU-1"
@@ -0,0 +1,80 @@
+import subprocess
+
+import pytest
+
+from changelogs import commit_message_validator as validator
+
+
+@pytest.fixture
+def hook_file(tmp_path):
+    path = tmp_path / "commit-msg"
+    path.write_text('SCOPES=("API" "UI")\n')
+    return str(path)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(validator, "SCOPES_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def test_hook_exits_zero_for_a_valid_message(hook_file, cache_dir, capsys):
+    assert validator.main(["--hook", hook_file, "feat(API): Add export"]) == 0
+    assert capsys.readouterr().out.strip() == validator.SUCCESS_MSG
+
+
+def test_hook_has_its_own_status_for_an_invalid_message(hook_file, cache_dir, capsys):
+    assert validator.main(["--hook", hook_file, "feat(DB): Add export"]) == validator.HOOK_INVALID_STATUS
+    assert capsys.readouterr().out.startswith(validator.INVALID_COMMIT_SCOPE)
+
+
+def test_cli_exits_one_for_an_invalid_message(capsys):
+    assert validator.main(["--scopes", "API", "--", "feat(DB): Add export"]) == 1
+
+
+def test_non_utf8_message_is_still_validated(hook_file, cache_dir, tmp_path, capsys):
+    message = tmp_path / "COMMIT_EDITMSG"
+    message.write_bytes("feat(API): Add caf\xe9 menu\n".encode("latin-1"))
+
+    assert validator.main(["--hook", hook_file, str(message)]) == 0
+
+
+def test_engine_errors_are_reported_without_a_traceback(tmp_path, cache_dir, capsys):
+    missing = str(tmp_path / "missing")
+
+    assert validator.main(["--hook", missing, "feat(API): Add export"]) == validator.ERROR_STATUS
+    output = capsys.readouterr()
+    assert output.out == ""
+    assert output.err.startswith("commit_message_validator: ")
+
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch):
+    def git(*args):
+        subprocess.run(["git", *args], check=True, capture_output=True)
+
+    monkeypatch.chdir(tmp_path)
+    git("init", "-q")
+    git("config", "user.name", "Jane")
+    git("config", "user.email", "jane@corp.com")
+    for message in ("feat(API): Add export", "fix(DB): Fix migration", "fix(API): Fix export"):
+        git("commit", "-q", "--allow-empty", "-m", message)
+    return git
+
+
+def test_range_reports_every_commit(repository, capsys):
+    assert validator.main(["--scopes", "API", "--range", "HEAD~2..HEAD"]) == 1
+    output = capsys.readouterr().out
+    assert "fix(DB): Fix migration" in output and validator.INVALID_COMMIT_SCOPE in output
+    assert "1/2 commit(s) valid" in output
+
+
+def test_range_max_count(repository, capsys):
+    assert validator.main(["--scopes", "API", "--range", "HEAD", "--max-count", "1"]) == 0
+    assert "1/1 commit(s) valid" in capsys.readouterr().out
+
+
+def test_bad_range_is_a_one_line_error(repository, capsys):
+    assert validator.main(["--scopes", "API", "--range", "nope..HEAD"]) == validator.ERROR_STATUS
+    error = capsys.readouterr().err
+    assert error.startswith("Error: git log failed for range 'nope..HEAD'")
+    assert error.count("\n") == 1
@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+from changelogs.commit_stats import CategorizedCommits, CommitStats, commit_stats, format_duration
+
+COMMITS = [
+    ("feat", "Jane", "2024-05-03T10:00:00Z", "API"),
+    ("fix", "Alan", "2024-05-01T08:00:00Z", "API"),
+    ("fix", "Jane", "2024-05-06T12:30:00Z", "UI"),
+    ("docs", "Jane", "", "UI")
+]
+
+
+def collect(commits=COMMITS):
+    stats = CommitStats()
+    for type_name, author, iso_date, scope in commits:
+        stats.add(type_name, author, iso_date, scope)
+    return stats
+
+
+def test_counts_overall_and_per_scope():
+    stats = collect()
+
+    assert stats.count == 4
+    assert stats.types == {"feat": 1, "fix": 2, "docs": 1}
+    assert stats.scopes["API"].count == 2
+    assert stats.scopes["UI"].types == {"fix": 1, "docs": 1}
+
+
+def test_first_and_last_dates_ignore_the_commit_order_and_missing_dates():
+    stats = collect()
+
+    assert (stats.first_date, stats.last_date) == ("2024-05-01T08:00:00Z", "2024-05-06T12:30:00Z")
+    assert (stats.scopes["UI"].first_date, stats.scopes["UI"].last_date) == ("2024-05-06T12:30:00Z",) * 2
+    assert stats.lead_time == timedelta(days=5, hours=4, minutes=30)
+    assert format_duration(stats.lead_time) == "5 d 4 h"
+
+
+def test_scope_without_dates_has_no_lead_time():
+    stats = collect([("docs", "Jane", "", "Readme")])
+
+    assert stats.lead_time is None
+    assert format_duration(stats.lead_time) == "-"
+    assert stats.to_dict()["first_date"] is None
+
+
+def test_author_tallies():
+    stats = collect()
+
+    assert stats.top_authors() == [("Jane", 3), ("Alan", 1)]
+    assert stats.top_authors(limit=1) == [("Jane", 3)]
+    assert stats.scopes["API"].authors == {"Jane": 1, "Alan": 1}
+
+
+def test_categorized_walk_matches_the_single_pass():
+    categorized = {}
+    for type_name, author, iso_date, scope in COMMITS:
+        categorized.setdefault(type_name, {}).setdefault(scope, []).append({"author": author, "iso_date": iso_date})
+
+    assert CommitStats.from_categorized(categorized).to_dict() == collect().to_dict()
+    assert commit_stats(categorized).to_dict() == collect().to_dict()
+
+
+def test_collected_stats_are_reused():
+    categorized = CategorizedCommits()
+    categorized.stats = collect()
+
+    assert commit_stats(categorized) is categorized.stats
@@ -0,0 +1,67 @@
+import logging
+import os
+
+import pytest
+
+from automatic_email import email_renderer
+from automatic_email.email_renderer import CompiledTemplate, load_template, render_batch
+
+
+def test_placeholders_are_substituted():
+    template = CompiledTemplate("<h1>{{appName}}</h1> {{tagName}} / {{appName}}")
+    assert template.placeholders == {"appName", "tagName"}
+    assert template.render({"appName": "POS", "tagName": "v1.2.0"}) == "<h1>POS</h1> v1.2.0 / POS"
+
+
+def test_missing_keys_are_left_in_place_and_reported(caplog):
+    template = CompiledTemplate("{{appName}} {{tagName}}")
+
+    with caplog.at_level(logging.WARNING, logger=email_renderer.__name__):
+        assert template.render({"appName": "POS"}) == "POS {{tagName}}"
+
+    assert caplog.messages == ["Missing template keys: ['tagName']"]
+
+
+def test_unknown_keys_are_reported(caplog):
+    template = CompiledTemplate("{{appName}}")
+
+    with caplog.at_level(logging.WARNING, logger=email_renderer.__name__):
+        assert template.render({"appName": "POS", "extra": "x"}) == "POS"
+
+    assert caplog.messages == ["Unknown template keys: ['extra']"]
+
+
+def test_strict_rendering_raises_on_missing_keys():
+    with pytest.raises(KeyError, match="tagName"):
+        CompiledTemplate("{{appName}} {{tagName}}").render({"appName": "POS"}, strict=True)
+
+
+def test_template_is_compiled_once_until_the_file_changes(tmp_path):
+    path = tmp_path / "template.html"
+    path.write_text("{{appName}}")
+
+    first = load_template(str(path))
+    assert load_template(str(path)) is first
+
+    path.write_text("{{tagName}}")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    changed = load_template(str(path))
+    assert changed is not first
+    assert changed.placeholders == {"tagName"}
+
+
+def test_render_batch_writes_one_email_per_repository(tmp_path, caplog):
+    path = tmp_path / "template.html"
+    path.write_text("{{appName}} {{tagName}} {{year}}")
+
+    with caplog.at_level(logging.WARNING, logger=email_renderer.__name__):
+        outputs = render_batch(str(path), str(tmp_path / "out"), "v2.0.0", ["DMSPOS", "Unlisted"])
+
+    assert list(outputs) == ["DMSPOS", "Unlisted"]
+    with open(outputs["DMSPOS"], encoding="utf-8") as file:
+        assert file.read().startswith("POS v2.0.0 ")
+    with open(outputs["Unlisted"], encoding="utf-8") as file:
+        assert file.read().startswith("Unknown v2.0.0 ")
+    # The context keys the template does not use are reported for every email
+    assert caplog.messages == ["Unknown template keys: ['date', 'releaseSummary']"] * 2
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from changelogs.base_interfaces import CommitFetcher
+from changelogs.basic_commit_parser import BasicCommitParser
+from changelogs.enhanced_commit_document_manager import EnhancedCommitDocumentManager
+
+COMMITS = [
+    {
+        "sha": "a" * 40,
+        "commit": {
+            "message": "feat(API): Add export\n\nRefs: #CU-1",
+            "author": {"name": "Jane", "email": "jane@corp.com", "date": "2024-05-01T10:00:00Z"}
+        },
+        "parents": [{"sha": "0" * 40}]
+    }
+]
+
+
+class LocalCommitFetcher(CommitFetcher):
+    def get_tags(self):
+        return "v2.0.0", "v1.0.0"
+
+    def get_commit_from_tag(self, tag):
+        return tag
+
+    def get_commits_between_refs(self, base_ref, head_ref):
+        return list(COMMITS)
+
+    def fetch_commits(self, branch="main"):
+        return list(COMMITS)
+
+    def _fetch_all_commits(self, branch):
+        return list(COMMITS)
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setenv("GITHUB_WORKSPACE", str(tmp_path))
+    for name in ("CHANGELOG_TRACKER", "CHANGELOG_EMAIL", "GITHUB_STEP_SUMMARY", "CHANGELOG_METRICS_PATH"):
+        monkeypatch.delenv(name, raising=False)
+    return tmp_path
+
+
+def make_manager(reports):
+    manager = EnhancedCommitDocumentManager(LocalCommitFetcher(), BasicCommitParser(), reports=reports)
+
+    def generate_pdf(html_file):
+        with open(os.path.splitext(html_file)[0] + '.pdf', 'w') as file:
+            file.write("%PDF")
+
+    manager.generate_pdf = generate_pdf
+    return manager
+
+
+def generated(workspace):
+    return sorted(name.rsplit('_', 1)[0] + os.path.splitext(name)[1]
+                  for name in os.listdir(workspace / "generated_docs") if name != "changelog_metrics.json")
+
+
+def test_pdf_only_reports_drop_the_intermediate_html(workspace):
+    make_manager("release_notes:pdf,commit_data").generate_all_documents()
+    assert generated(workspace) == ["commit_data.ndjson", "release_notes.pdf"]
+
+
+def test_html_and_pdf_reports_keep_both(workspace):
+    make_manager("release_notes:html+pdf").generate_all_documents()
+    assert generated(workspace) == ["release_notes.html", "release_notes.pdf"]
+
+
+def test_html_only_reports_skip_the_pdf(workspace):
+    make_manager("release_notes:html").generate_all_documents()
+    assert generated(workspace) == ["release_notes.html"]
@@ -0,0 +1,64 @@
+from changelogs.identity_index import IdentityIndex, Mailmap
+
+
+def test_proper_name_for_commit_email():
+    mailmap = Mailmap(["Jane Doe <jane@corp.com>"])
+    assert mailmap.resolve("jane", "JANE@corp.com") == ("Jane Doe", "JANE@corp.com")
+
+
+def test_proper_email_for_commit_email():
+    mailmap = Mailmap(["<jane@corp.com> <jane@old.com>"])
+    assert mailmap.resolve("jane", "jane@old.com") == ("jane", "jane@corp.com")
+
+
+def test_proper_name_and_email_for_commit_email():
+    mailmap = Mailmap(["Jane Doe <jane@corp.com> <jane@old.com>"])
+    assert mailmap.resolve("jd", "Jane@Old.com") == ("Jane Doe", "jane@corp.com")
+
+
+def test_proper_name_and_email_for_commit_name_and_email():
+    mailmap = Mailmap(["Jane Doe <jane@corp.com> jdoe <jdoe@old.com>"])
+    assert mailmap.resolve("jdoe", "jdoe@old.com") == ("Jane Doe", "jane@corp.com")
+    # Names are matched exactly
+    assert mailmap.resolve("J. Doe", "jdoe@old.com") == ("J. Doe", "jdoe@old.com")
+
+
+def test_comments_and_blank_lines_are_ignored():
+    mailmap = Mailmap(["# Team", "", "Jane Doe <jane@corp.com>  # moved teams"])
+    assert len(mailmap) == 1
+    assert mailmap.resolve("jane", "jane@corp.com") == ("Jane Doe", "jane@corp.com")
+
+
+def test_mailmap_name_wins_whatever_the_commit_order():
+    lines = ["Jane Doe <jane@corp.com> jdoe <jdoe@old.com>"]
+    authors = [("jane", "jane@corp.com"), ("jdoe", "jdoe@old.com")]
+
+    for order in (authors, authors[::-1]):
+        index = IdentityIndex(Mailmap(lines))
+        assert [index.identity(*author) for author in order] == [("Jane Doe", "jane@corp.com")] * 2
+
+
+def test_unmapped_spellings_take_the_first_name_seen():
+    index = IdentityIndex()
+    assert index.identity("Alan Smith", "alan@x.io") == ("Alan Smith", "alan@x.io")
+    assert index.identity("A. Smith", "ALAN@x.io") == ("Alan Smith", "ALAN@x.io")
+
+
+def test_commits_are_indexed_by_author_and_normalised_ref():
+    index = IdentityIndex()
+    first = {"author": "Jane Doe", "refs": ["#CU-1", "#cu-2"]}
+    second = {"author": "Jane Doe", "refs": ["#CU-2"]}
+    index.add(first)
+    index.add(second)
+
+    assert index.commits_by_author == {"Jane Doe": [first, second]}
+    assert index.commits_by_ref == {"CU-1": [first], "CU-2": [first, second]}
+
+
+def test_refs_keep_the_id_as_first_written():
+    index = IdentityIndex()
+    index.add({"author": "Jane Doe", "refs": ["#CU-86abc"]})
+    index.add({"author": "Jane Doe", "refs": ["#cu-86ABC"]})
+
+    assert list(index.commits_by_ref) == ["CU-86ABC"]
+    assert index.ref_ids == {"CU-86ABC": "CU-86abc"}
@@ -0,0 +1,20 @@
+import importlib.util
+import os
+
+import pytest
+
+# The import-time check lives in the standards repository's scripts/, not in the installed copies
+CHECK_SCRIPT = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'scripts', 'check_import_time.py')
+
+if not os.path.isfile(CHECK_SCRIPT):
+    pytest.skip("scripts/check_import_time.py is not available", allow_module_level=True)
+
+spec = importlib.util.spec_from_file_location("check_import_time", CHECK_SCRIPT)
+check_import_time = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(check_import_time)
+
+
+@pytest.mark.parametrize("module", check_import_time.DEFAULT_MODULES)
+def test_entry_point_imports_within_budget(module):
+    best_ms, status = check_import_time.check(module)
+    assert status == "ok", f"{module} took {best_ms:.1f} ms: {status}"
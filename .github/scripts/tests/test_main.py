@@ -0,0 +1,29 @@
+import pytest
+
+from changelogs import main
+
+
+@pytest.fixture
+def credentials(monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+    monkeypatch.setenv("REPO_OWNER", "owner")
+    monkeypatch.setenv("REPO_NAME", "repo")
+    monkeypatch.setenv("CHANGELOG_PROFILE", "false")
+
+
+def test_missing_credentials_fail(monkeypatch):
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    assert main.main([]) == 1
+
+
+def test_generation_errors_fail(credentials, monkeypatch):
+    def fail(*args):
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(main, "generate_reports", fail)
+    assert main.main([]) == 1
+
+
+def test_successful_run_exits_zero(credentials, monkeypatch):
+    monkeypatch.setattr(main, "generate_reports", lambda *args: None)
+    assert main.main([]) == 0
@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from changelogs import metrics
+from changelogs.metrics import PipelineMetrics
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(metrics, "time", clock)
+    return clock
+
+
+def test_timer_records_the_stage_with_its_details(clock):
+    pipeline = PipelineMetrics()
+    with pipeline.timer("fetch", ref="v1.0.0") as stage:
+        clock.now += 1.5
+        stage["commits"] = 42
+
+    assert pipeline.stages == [{"stage": "fetch", "ref": "v1.0.0", "commits": 42, "status": "ok", "seconds": 1.5}]
+
+
+def test_timer_records_failed_stages(clock):
+    pipeline = PipelineMetrics()
+    with pytest.raises(ValueError):
+        with pipeline.timer("render"):
+            clock.now += 0.25
+            raise ValueError("bad template")
+
+    assert pipeline.stages == [{"stage": "render", "status": "error: bad template", "seconds": 0.25}]
+
+
+def test_requests_are_aggregated(clock):
+    pipeline = PipelineMetrics()
+    pipeline.record_request("GET", "/tags", 0.2, FakeResponse(content=b"x" * 1024, headers={
+        "X-RateLimit-Remaining": "4999", "X-RateLimit-Limit": "5000"
+    }))
+    pipeline.record_request("GET", "/compare", 0.3, FakeResponse(content=b"x" * 2048, headers={
+        "X-RateLimit-Remaining": "4998"
+    }))
+    pipeline.record_request("GET", "/commits", 0.5, error="timeout")
+    clock.now += 2
+
+    data = pipeline.to_dict()
+
+    assert pipeline.requests[0] == {
+        "method": "GET", "url": "/tags", "seconds": 0.2, "status": 200, "bytes": 1024,
+        "rate_limit": 5000, "rate_remaining": 4999
+    }
+    assert pipeline.requests[2] == {"method": "GET", "url": "/commits", "seconds": 0.5, "error": "timeout"}
+    assert data["http"] == {"count": 3, "seconds": 1.0, "bytes": 3072, "rate_remaining": 4998}
+    assert data["total_seconds"] == 2
+
+
+def test_summary_lists_stages_and_requests(clock):
+    pipeline = PipelineMetrics()
+    pipeline.record_stage("render:markdown", 0.125, worker="process")
+    pipeline.record_request("GET", "/tags", 0.5, FakeResponse(content=b"x" * 512, headers={
+        "X-RateLimit-Remaining": "10"
+    }))
+    clock.now += 3
+
+    summary = pipeline.render_summary()
+
+    assert "| render:markdown | 0.125 | worker=process, status=ok |" in summary
+    assert "**GitHub API:** 1 request(s), 0.500s, 0.5 KiB, rate limit remaining: 10" in summary
+    assert "**Total:** 3.000s" in summary
+
+
+def test_step_summary_and_json_are_written(clock, tmp_path, monkeypatch):
+    pipeline = PipelineMetrics()
+    pipeline.record_stage("fetch", 1)
+    summary_file = tmp_path / "summary.md"
+    summary_file.write_text("previous step\n")
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary_file))
+
+    pipeline.write_step_summary()
+    path = pipeline.write_json(str(tmp_path / "out" / "metrics.json"))
+
+    assert summary_file.read_text().startswith("previous step\n### Changelog generation")
+    with open(path, encoding="utf-8") as file:
+        assert json.load(file)["stages"] == [{"stage": "fetch", "status": "ok", "seconds": 1}]
+
+
+def test_step_summary_is_skipped_outside_actions(monkeypatch):
+    monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+    PipelineMetrics().write_step_summary()
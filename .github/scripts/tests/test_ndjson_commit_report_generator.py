@@ -0,0 +1,24 @@
+import json
+
+from changelogs.commit_stats import CategorizedCommits
+from changelogs.ndjson_commit_report_generator import NdjsonCommitReportGenerator
+
+
+def test_ticket_payload_does_not_override_record_and_id():
+    commits = CategorizedCommits(feat={})
+    commits.tickets = {"CU-1": {"id": "86abc", "record": "task", "title": "Login"}}
+
+    records = [json.loads(line) for line in NdjsonCommitReportGenerator().stream(commits)]
+    tickets = [record for record in records if record["record"] == "ticket"]
+
+    assert tickets == [{"record": "ticket", "id": "CU-1", "title": "Login"}]
+
+
+def test_ticket_id_is_written_as_in_the_commit():
+    commits = CategorizedCommits(feat={})
+    commits.identities.add({"author": "Jane", "refs": ["#CU-86abc"]})
+    commits.tickets = {"CU-86ABC": {"title": "Login"}}
+
+    records = [json.loads(line) for line in NdjsonCommitReportGenerator().stream(commits)]
+
+    assert [record["id"] for record in records if record["record"] == "ticket"] == ["CU-86abc"]
@@ -0,0 +1,116 @@
+from changelogs.range_folding import fold_commits
+
+FEATURE = "a" * 40
+FIX = "b" * 40
+REVERT = "c" * 40
+REVERT_OF_REVERT = "d" * 40
+
+
+def commit(sha, message, parents=("0" * 40,)):
+    return {"sha": sha, "commit": {"message": message}, "parents": [{"sha": parent} for parent in parents]}
+
+
+def shas(commits):
+    return [c["sha"] for c in commits]
+
+
+def test_revert_matched_by_full_sha():
+    commits = [
+        commit(FEATURE, "feat(API): Add export"),
+        commit(FIX, "fix(UI): Fix button"),
+        commit(REVERT, f'Revert "feat(API): Add export"\n\nThis reverts commit {FEATURE}.')
+    ]
+    kept, counts = fold_commits(commits)
+    assert shas(kept) == [FIX]
+    assert counts == {"reverted": 1, "reverts": 1, "merges": 0}
+
+
+def test_revert_matched_by_short_sha():
+    commits = [
+        commit(FEATURE, "feat(API): Add export"),
+        commit(REVERT, f"fix(API): Drop the export again\n\nThis reverts commit {FEATURE[:7]}.")
+    ]
+    kept, _ = fold_commits(commits)
+    assert kept == []
+
+
+def test_revert_matched_by_header_only():
+    commits = [
+        commit(FEATURE, "feat(API): Add export"),
+        commit(FIX, "fix(UI): Fix button"),
+        commit(REVERT, 'Revert "feat(API): Add export"')
+    ]
+    kept, _ = fold_commits(commits)
+    assert shas(kept) == [FIX]
+
+
+def test_revert_of_a_revert_keeps_the_original():
+    commits = [
+        commit(FEATURE, "feat(API): Add export"),
+        commit(REVERT, f'Revert "feat(API): Add export"\n\nThis reverts commit {FEATURE}.'),
+        commit(REVERT_OF_REVERT, f'Revert "Revert "feat(API): Add export""\n\nThis reverts commit {REVERT}.')
+    ]
+    kept, counts = fold_commits(commits)
+    assert shas(kept) == [FEATURE]
+    assert counts == {"reverted": 1, "reverts": 1, "merges": 0}
+
+
+def test_revert_of_a_commit_outside_the_range_is_kept():
+    commits = [
+        commit(FIX, "fix(UI): Fix button"),
+        commit(REVERT, f'Revert "feat(API): Add export"\n\nThis reverts commit {"e" * 40}.')
+    ]
+    kept, counts = fold_commits(commits)
+    assert shas(kept) == [FIX, REVERT]
+    assert counts == {"reverted": 0, "reverts": 0, "merges": 0}
+
+
+def test_merge_with_merged_parent_in_range_is_dropped():
+    merge = "f" * 40
+    commits = [
+        commit(FIX, "fix(UI): Fix button"),
+        commit(FEATURE, "feat(API): Add export"),
+        commit(merge, "feat(API): Add export (#12)", parents=(FIX, FEATURE))
+    ]
+    kept, counts = fold_commits(commits)
+    assert shas(kept) == [FIX, FEATURE]
+    assert counts["merges"] == 1
+
+
+def test_merge_with_merged_parent_outside_range_is_kept():
+    merge = "f" * 40
+    commits = [
+        commit(FIX, "fix(UI): Fix button"),
+        commit(merge, "feat(API): Add export (#12)", parents=(FIX, "e" * 40))
+    ]
+    kept, counts = fold_commits(commits)
+    assert shas(kept) == [FIX, merge]
+    assert counts["merges"] == 0
+
+
+def test_parents_are_looked_up_when_missing_from_the_payload():
+    merge = {"sha": "f" * 40, "commit": {"message": "feat(API): Add export (#12)"}}
+    kept, _ = fold_commits([commit(FEATURE, "feat(API): Add export"), merge],
+                           parents_lookup=lambda sha: [FIX, FEATURE])
+    assert shas(kept) == [FEATURE]
+
+
+def test_newest_first_ranges_keep_their_order():
+    commits = [
+        commit(REVERT, f'Revert "feat(API): Add export"\n\nThis reverts commit {FEATURE}.'),
+        commit(FIX, "fix(UI): Fix button"),
+        commit(FEATURE, "feat(API): Add export")
+    ]
+    kept, _ = fold_commits(commits, newest_first=True)
+    assert shas(kept) == [FIX]
+
+
+def test_revert_naming_a_sha_outside_the_range_does_not_match_by_header():
+    # The feature was reverted before the range and re-applied inside it
+    commits = [
+        commit(FEATURE, "feat(API): Add export"),
+        commit(REVERT, f'Revert "feat(API): Add export"\n\nThis reverts commit {"e" * 40}.')
+    ]
+    kept, counts = fold_commits(commits)
+    assert shas(kept) == [FEATURE, REVERT]
+    assert counts == {"reverted": 0, "reverts": 0, "merges": 0}
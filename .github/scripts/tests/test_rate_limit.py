@@ -0,0 +1,137 @@
+import pytest
+
+from changelogs.rate_limit import SECONDARY_BACKOFF, CachedResponse, RateLimitBudget, RateLimitExceeded
+
+
+class FakeTime:
+    """Clock and sleep for RateLimitBudget, sleeping advances the clock"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, headers=None, data=None, text=""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._data = data
+        self.text = text
+
+    def json(self):
+        return self._data
+
+
+@pytest.fixture
+def fake_time():
+    return FakeTime()
+
+
+def make_budget(fake_time, **kwargs):
+    kwargs.setdefault("min_interval", 0)
+    return RateLimitBudget(sleep=fake_time.sleep, clock=fake_time.clock, **kwargs)
+
+
+def quota(remaining, reset_at):
+    return FakeResponse(headers={
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset_at)
+    })
+
+
+def test_requests_are_spaced_by_min_interval(fake_time):
+    budget = make_budget(fake_time, min_interval=0.5)
+    budget.acquire()
+    budget.acquire()
+    assert fake_time.sleeps == [0.5]
+
+
+def test_reserve_waits_for_the_reset(fake_time):
+    budget = make_budget(fake_time, reserve=10)
+    budget.update(quota(10, fake_time.now + 120))
+
+    budget.acquire()
+
+    assert fake_time.sleeps == [121]
+    assert budget.paused_seconds == 121
+
+
+def test_conditional_requests_may_use_the_reserve(fake_time):
+    budget = make_budget(fake_time, reserve=10)
+    budget.update(quota(5, fake_time.now + 120))
+
+    budget.acquire(conditional=True)
+
+    assert fake_time.sleeps == []
+
+
+def test_reset_beyond_max_wait_raises(fake_time):
+    budget = make_budget(fake_time, reserve=10, max_wait=60)
+    budget.update(quota(0, fake_time.now + 3600))
+
+    with pytest.raises(RateLimitExceeded) as error:
+        budget.acquire()
+    assert error.value.resume_at == fake_time.now + 3600
+    assert fake_time.sleeps == []
+
+
+def test_retry_after_is_honoured(fake_time):
+    budget = make_budget(fake_time)
+    assert budget.retry_delay(FakeResponse(429, {"Retry-After": "30"}), attempt=0) == 30
+
+
+def test_retry_after_beyond_max_wait_raises(fake_time):
+    budget = make_budget(fake_time, max_wait=60)
+    with pytest.raises(RateLimitExceeded):
+        budget.retry_delay(FakeResponse(429, {"Retry-After": "3600"}), attempt=0)
+
+
+def test_primary_limit_waits_for_the_reset(fake_time):
+    budget = make_budget(fake_time, max_wait=60)
+    response = FakeResponse(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(fake_time.now + 30)})
+    budget.update(response)
+    assert budget.retry_delay(response, attempt=0) == 31
+
+    response.headers["X-RateLimit-Reset"] = str(fake_time.now + 3600)
+    budget.update(response)
+    with pytest.raises(RateLimitExceeded):
+        budget.retry_delay(response, attempt=0)
+
+
+def test_secondary_limit_backs_off_exponentially(fake_time):
+    budget = make_budget(fake_time, max_retries=3)
+    response = FakeResponse(403, text="You have exceeded a secondary rate limit")
+
+    assert [budget.retry_delay(response, attempt) for attempt in range(4)] == [
+        SECONDARY_BACKOFF, SECONDARY_BACKOFF * 2, SECONDARY_BACKOFF * 4, None
+    ]
+
+
+def test_plain_forbidden_is_not_retried(fake_time):
+    budget = make_budget(fake_time)
+    assert budget.retry_delay(FakeResponse(403, text="Resource not accessible"), attempt=0) is None
+
+
+def test_etag_is_reused_on_304(fake_time, tmp_path):
+    cache_path = str(tmp_path / "cache.json")
+    budget = make_budget(fake_time, cache_path=cache_path)
+    key = budget.cache_key("https://api.github.com/repos/o/r/tags", {"page": 1})
+
+    assert budget.conditional_headers(key) == {}
+    budget.resolve(key, FakeResponse(200, {"ETag": '"abc"'}, data=[{"name": "v1"}]))
+    budget.save()
+
+    # A later run sends the ETag and reads the body from the persisted cache
+    resumed = make_budget(fake_time, cache_path=cache_path)
+    assert resumed.conditional_headers(key) == {"If-None-Match": '"abc"'}
+    cached = resumed.resolve(key, FakeResponse(304))
+    assert isinstance(cached, CachedResponse)
+    assert cached.json() == [{"name": "v1"}]
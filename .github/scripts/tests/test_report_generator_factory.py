@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from changelogs.report_generator_factory import ReportGeneratorFactory
+
+
+@pytest.fixture
+def factory(monkeypatch):
+    monkeypatch.setattr(ReportGeneratorFactory, "_registry", dict(ReportGeneratorFactory._registry))
+    monkeypatch.setattr(ReportGeneratorFactory, "_instances", {})
+    return ReportGeneratorFactory
+
+
+@pytest.fixture
+def probe_module(tmp_path, monkeypatch):
+    """A generator module outside the package, imported by no other test"""
+    (tmp_path / "lazy_probe_generator.py").write_text("class ProbeGenerator:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_probe_generator", raising=False)
+    return "lazy_probe_generator"
+
+
+def test_generators_are_not_imported_with_the_factory():
+    script = (
+        "import sys, changelogs.report_generator_factory as f; "
+        "print(sorted(m for m, _ in f.ReportGeneratorFactory._registry.values() "
+        "if 'changelogs' + m in sys.modules))"
+    )
+    package_root = os.path.join(os.path.dirname(__file__), '..')
+    result = subprocess.run([sys.executable, "-c", script], cwd=package_root,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_generator_is_imported_on_first_use_then_cached(factory, probe_module):
+    factory.register("probe", probe_module, "ProbeGenerator")
+    assert probe_module not in sys.modules
+
+    generator = factory.create_generator("probe")
+    assert probe_module in sys.modules
+    assert type(generator).__name__ == "ProbeGenerator"
+
+    # The cached instance is served without importing the module again
+    del sys.modules[probe_module]
+    assert factory.create_generator("probe") is generator
+    assert probe_module not in sys.modules
+
+
+def test_registering_again_drops_the_cached_instance(factory, probe_module):
+    factory.register("probe", probe_module, "ProbeGenerator")
+    first = factory.create_generator("probe")
+
+    factory.register("probe", probe_module, "ProbeGenerator")
+    assert factory.create_generator("probe") is not first
+
+
+def test_unknown_type_returns_none(factory):
+    assert factory.create_generator("pdf") is None
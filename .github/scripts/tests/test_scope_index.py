@@ -0,0 +1,83 @@
+import marshal
+
+from changelogs.commit_message_validator import CommitMessageValidator, load_cached_scope_index, parse_scopes
+from changelogs.scope_index import BKTree, ScopeIndex, levenshtein
+
+SCOPES = ["Authentication", "API", "Database", "UI", "Payments"]
+
+
+def test_levenshtein():
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("", "API") == 3
+    assert levenshtein("API", "API") == 0
+
+
+def test_bk_tree_search_matches_a_linear_scan():
+    words = ["authentication", "api", "database", "ui", "payments", "apis", "data"]
+    tree = BKTree.build(words)
+
+    for word in ("apu", "dta", "payment", "xyz"):
+        for max_distance in (1, 2, 3):
+            expected = sorted((levenshtein(word, w), w) for w in words if levenshtein(word, w) <= max_distance)
+            assert tree.search(word, max_distance) == expected
+
+
+def test_typo_suggests_the_nearest_scope():
+    index = ScopeIndex(SCOPES)
+    assert index.suggest("Authentcation") == ["Authentication"]
+    assert index.suggest("Databse") == ["Database"]
+
+
+def test_suggestions_are_closest_first_and_limited():
+    index = ScopeIndex(["API", "APP", "UI", "APIs", "AP"])
+    assert index.suggest("APX") == ["AP", "API", "APP"]
+    assert index.suggest("APX", limit=10) == ["AP", "API", "APP", "APIs"]
+
+
+def test_distance_cutoff_grows_with_the_scope_length():
+    index = ScopeIndex(SCOPES)
+    # Short scopes allow 2 edits, longer ones one per three characters
+    assert index.suggest("Dtbs") == []
+    assert index.suggest("Xyz") == []
+    assert index.suggest("Paymnts") == ["Payments"]
+    assert index.suggest("Authxntixatiox") == ["Authentication"]
+    assert index.suggest("Axxxxntixatiox") == []
+
+
+def test_case_sensitive_scopes_suggest_the_right_case():
+    index = ScopeIndex(SCOPES)
+    assert "api" not in index
+    assert index.suggest("api")[0] == "API"
+
+
+def test_case_insensitive_scopes_accept_any_case():
+    index = ScopeIndex(["API", "Api"], case_sensitive=False)
+    assert "api" in index and "aPI" in index
+    assert len(index) == 1
+    # Every spelling of scopes.sh is suggested
+    assert index.suggest("APII") == ["API", "Api"]
+
+
+def test_scope_case_rule_is_read_from_scopes_sh():
+    assert parse_scopes('SCOPES=("API" "UI")') == (["API", "UI"], True)
+    assert parse_scopes('SCOPE_CASE="insensitive"\nSCOPES=("API")') == (["API"], False)
+
+
+def test_invalid_scope_tip_lists_the_suggestions():
+    result = CommitMessageValidator(SCOPES).validate("feat(Paymnts): Add refunds")
+    assert not result.valid
+    assert result.tip == "💡 Did you mean: Payments?"
+
+
+def test_cached_index_keeps_the_tree_and_case_rule(tmp_path):
+    scopes_file = tmp_path / "scopes.sh"
+    scopes_file.write_text('SCOPE_CASE="insensitive"\nSCOPES=("API" "Database")\n')
+    cache_dir = str(tmp_path / "cache")
+
+    built = load_cached_scope_index(str(scopes_file), cache_dir)
+    (artefact,) = (tmp_path / "cache").iterdir()
+    assert marshal.loads(artefact.read_bytes())["tree"] == built.tree.root
+
+    cached = load_cached_scope_index(str(scopes_file), cache_dir)
+    assert "database" in cached
+    assert cached.suggest("Databse") == ["Database"]
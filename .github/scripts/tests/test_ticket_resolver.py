@@ -0,0 +1,131 @@
+import json
+
+import pytest
+
+from changelogs.ticket_resolver import ClickUpTrackerClient, FileTrackerClient, TicketCache, TicketResolver
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingClient(FileTrackerClient):
+    """FileTrackerClient remembering the batches it was asked for"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.batches = []
+
+    def fetch_tickets(self, ticket_ids):
+        self.batches.append(list(ticket_ids))
+        return super().fetch_tickets(ticket_ids)
+
+
+@pytest.fixture
+def tracker_file(tmp_path):
+    path = tmp_path / "tickets.json"
+    path.write_text(json.dumps({
+        f"cu-{i}": {"title": f"Ticket {i}", "status": "done", "url": f"https://app.clickup.com/t/{i}"}
+        for i in range(1, 61)
+    }))
+    return str(path)
+
+
+def test_unique_refs_are_resolved_in_batches(tracker_file):
+    client = RecordingClient(tracker_file)
+    resolver = TicketResolver(client, TicketCache(), batch_size=25)
+
+    tickets = resolver.resolve([f"CU-{i}" for i in range(1, 61)] * 2)
+
+    assert len(tickets) == 60
+    assert [len(batch) for batch in client.batches] == [25, 25, 10]
+    assert tickets["CU-7"]["title"] == "Ticket 7"
+
+
+def test_cached_tickets_are_not_fetched_again(tracker_file, tmp_path):
+    clock = Clock()
+    cache_path = str(tmp_path / "cache.json")
+    TicketResolver(FileTrackerClient(tracker_file), TicketCache(cache_path, ttl=60, clock=clock)).resolve(["CU-1"])
+
+    client = FileTrackerClient(tracker_file)
+    tickets = TicketResolver(client, TicketCache(cache_path, ttl=60, clock=clock)).resolve(["CU-1"])
+
+    assert client.calls == 0
+    assert tickets == {"CU-1": {"title": "Ticket 1", "status": "done", "url": "https://app.clickup.com/t/1"}}
+
+
+def test_expired_tickets_are_fetched_again(tracker_file, tmp_path):
+    clock = Clock()
+    cache_path = str(tmp_path / "cache.json")
+    TicketResolver(FileTrackerClient(tracker_file), TicketCache(cache_path, ttl=60, clock=clock)).resolve(["CU-1"])
+
+    clock.now += 61
+    client = FileTrackerClient(tracker_file)
+    tickets = TicketResolver(client, TicketCache(cache_path, ttl=60, clock=clock)).resolve(["CU-1"])
+
+    assert client.calls == 1
+    assert "CU-1" in tickets
+
+
+def test_unknown_refs_are_left_out_and_cached(tracker_file):
+    clock = Clock()
+    client = FileTrackerClient(tracker_file)
+    resolver = TicketResolver(client, TicketCache(ttl=60, clock=clock))
+
+    assert resolver.resolve(["CU-1", "CU-999"]) == {"CU-1": resolver.cache.get("CU-1")}
+    assert resolver.resolve(["CU-999"]) == {}
+    assert client.calls == 1
+
+    clock.now += 61
+    resolver.resolve(["CU-999"])
+    assert client.calls == 2
+
+
+def test_tracker_failures_leave_the_refs_unresolved(tracker_file):
+    class FailingClient(FileTrackerClient):
+        def fetch_tickets(self, ticket_ids):
+            raise ConnectionError("tracker down")
+
+    resolver = TicketResolver(FailingClient(tracker_file), TicketCache())
+
+    assert resolver.resolve(["CU-1"]) == {}
+    # Failures are not cached, the next run tries again
+    with pytest.raises(KeyError):
+        resolver.cache.get("CU-1")
+
+
+def test_file_tracker_matches_ids_in_any_case(tracker_file):
+    assert FileTrackerClient(tracker_file).fetch_tickets(["cu-7"])["cu-7"]["title"] == "Ticket 7"
+
+
+def test_clickup_task_ids_are_sent_as_written():
+    class Response:
+        status_code = 200
+        content = b"{}"
+        headers = {}
+
+        @staticmethod
+        def json():
+            return {"name": "Login", "status": {"status": "done"}}
+
+    class Session:
+        def __init__(self):
+            self.urls = []
+
+        def get(self, url, timeout):
+            self.urls.append(url)
+            return Response()
+
+    client = ClickUpTrackerClient("token")
+    client.session = Session()
+
+    tickets = client.fetch_tickets(["CU-86abc", "cu-86def", "JIRA-1"])
+
+    assert client.session.urls == [
+        "https://api.clickup.com/api/v2/task/86abc", "https://api.clickup.com/api/v2/task/86def"
+    ]
+    assert tickets["CU-86abc"]["url"] == "https://app.clickup.com/t/86abc"
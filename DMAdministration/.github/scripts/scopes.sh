@@ -0,0 +1,11 @@
+# Define valid scopes for the "DMAdministration" repository
+SCOPES=(
+"authentication" 
+"account-management" 
+"profile-management"
+"user-management"
+"site-management"
+"dictionary-management"
+"terminal-management"
+"zone-management"
+)
\ No newline at end of file
@@ -0,0 +1,8 @@
+# Define valid scopes for the "DMDashboard" repository
+SCOPES=(
+"authentication" 
+"account-management" 
+"purchases"
+"sales"
+"stock"
+)
\ No newline at end of file
@@ -0,0 +1,8 @@
+# Define valid scopes for the "DMExpoImpo" repository
+SCOPES=(
+"authentication" 
+"account-management" 
+"product-integration"
+"purchasing-integration"
+"sales-integration"
+)
\ No newline at end of file
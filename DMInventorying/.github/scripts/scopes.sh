@@ -0,0 +1,7 @@
+# Define valid scopes for the "DMInventorying" repository
+SCOPES=(
+"authentication" 
+"account-management" 
+"dashboard"
+"inventory"
+)
\ No newline at end of file
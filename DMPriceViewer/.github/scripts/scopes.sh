@@ -0,0 +1,4 @@
+# Define valid scopes for the "DMPriceViewer" repository
+SCOPES=(
+"price-viewer" 
+)
\ No newline at end of file
@@ -0,0 +1,6 @@
+# Define valid scopes for the "DMReferentiel" repository
+SCOPES=(
+"product-management" 
+"supplier-management" 
+"customer-management"
+)
\ No newline at end of file
@@ -7,8 +7,8 @@ COLOR_RED="\033[1;31m"
 COLOR_YELLOW="\033[1;33m"
 
 # Template repository URL
-TEMPLATE_REPO_URL="https://github.com/decodevM/datamaster-dev-standards.git"
-TEMPLATE_DIR=".temp-templates"
+TEMPLATE_REPO_URL="${TEMPLATE_REPO_URL:-https://github.com/decodevM/datamaster-dev-standards.git}"
+TEMPLATE_DIR=".temp-templates"  # Cached clone, kept in .git between updates
 
 cd ../..  # Ensure we're in the project root
 
@@ -22,20 +22,28 @@ print_message() {
   echo -e "$1$2$COLOR_RESET"
 }
 
-# 🔥 Clone or update the template repository
-if [ -d "$TEMPLATE_DIR" ]; then
-  # Run git pull in the background and discard output
-  cd "$TEMPLATE_DIR" && git pull origin main > /dev/null 2>&1 
-  cd ..
-else
-  # Run git clone in the background and discard output
-  git clone "$TEMPLATE_REPO_URL" "$TEMPLATE_DIR" > /dev/null 2>&1
-fi
-
+# 🔥 Fetch only the shared .github and this repository's overlay: shallow, without other blobs, sparse
+fetch_templates() {
+  if [ -d "$TEMPLATE_DIR/.git" ]; then
+    # Also turns an old full clone into a sparse one
+    git -C "$TEMPLATE_DIR" sparse-checkout set .github "$REPOSITORY_NAME" > /dev/null 2>&1
+    if git -C "$TEMPLATE_DIR" fetch --depth 1 origin main > /dev/null 2>&1 &&
+      git -C "$TEMPLATE_DIR" reset --hard FETCH_HEAD > /dev/null 2>&1; then
+      return 0
+    fi
+    rm -rf "$TEMPLATE_DIR"  # Broken cache, clone it again
+  fi
 
+  # Partial clones need git 2.25+, fall back to a plain shallow clone
+  git clone --depth 1 --filter=blob:none --sparse --branch main "$TEMPLATE_REPO_URL" "$TEMPLATE_DIR" > /dev/null 2>&1 ||
+    git clone --depth 1 --branch main "$TEMPLATE_REPO_URL" "$TEMPLATE_DIR" > /dev/null 2>&1 ||
+    return 1
+  git -C "$TEMPLATE_DIR" sparse-checkout set .github "$REPOSITORY_NAME" > /dev/null 2>&1
+  return 0
+}
 
 # 🚨 Check if cloning or updating was successful
-if [ $? -ne 0 ]; then
+if ! fetch_templates; then
   print_message "$COLOR_RED" "Failed to fetch the template repository. Please check the URL or connection."
   exit 1
 fi
@@ -49,16 +57,71 @@ if [ ! -d "$CONFIG_DIR" ]; then
   exit 1
 fi
 
-# 📑 Update GitHub Actions
-# print_message "$COLOR_YELLOW" "Updating GitHub Actions..."
-rm -rf ../.github
-mkdir ../.github
-cp -r "$CONFIG_DIR/.github/"* ../.github/
+# 🔁 Sync only the files whose content changed since the last update
+MANIFEST_FILE="template-manifest"  # Hashes of the installed template files, kept in .git
+
+if command -v sha256sum > /dev/null 2>&1; then
+  HASH_CMD="sha256sum"
+else
+  HASH_CMD="shasum -a 256"  # macOS
+fi
+
+# The standards repository's own tests and their workflow, they only run against its tree
+# (a previous install of them is removed as stale)
+TEMPLATE_ONLY_PATHS=(".github/scripts/tests" ".github/workflows/tests.yml")
+
+# Print "<hash>  <installed path>" for every template file: the shared .github with the
+# repository's own .github and hooks on top; hooks/ is installed as .git/hooks/
+template_hashes() {
+  local excluded=()
+  for path in "${TEMPLATE_ONLY_PATHS[@]}"; do
+    excluded+=(-o -path "$path")
+  done
+  {
+    (cd "$TEMPLATE_DIR" && find .github \( -name __pycache__ "${excluded[@]}" \) -prune -o -type f -print0 | xargs -0 $HASH_CMD)
+    (cd "$CONFIG_DIR" && find .github hooks -name __pycache__ -prune -o -type f -print0 2>/dev/null | xargs -0 $HASH_CMD) |
+      sed 's#  hooks/#  .git/hooks/#'
+  } | awk '{ files[substr($0, index($0, "  ") + 2)] = $0 } END { for (path in files) print files[path] }' |
+    LC_ALL=C sort
+}
 
-# 🔑 Update commit-msg hook
-# print_message "$COLOR_YELLOW" "Updating commit-msg hook..."
-cp "$CONFIG_DIR/hooks/"* hooks/
-chmod +x hooks/*
+# Print the hashes of the installed copies of the given template files
+installed_hashes() {
+  while IFS= read -r line; do
+    path="${line#*  }"
+    [ -f "../$path" ] && printf '%s\0' "$path"
+  done | (cd .. && xargs -0 $HASH_CMD 2>/dev/null) | LC_ALL=C sort
+}
+
+TEMPLATE_HASHES=$(template_hashes)
+INSTALLED_HASHES=$(printf '%s\n' "$TEMPLATE_HASHES" | installed_hashes)
+
+# Template files that are missing or differ from the installed copy
+CHANGED=$(LC_ALL=C comm -23 <(printf '%s\n' "$TEMPLATE_HASHES") <(printf '%s\n' "$INSTALLED_HASHES") | sed 's/^[^ ]*  //')
+
+# Files installed by a previous update that the template no longer has
+STALE=""
+if [ -f "$MANIFEST_FILE" ]; then
+  STALE=$(LC_ALL=C comm -23 <(sed 's/^[^ ]*  //' "$MANIFEST_FILE" | LC_ALL=C sort) <(printf '%s\n' "$TEMPLATE_HASHES" | sed 's/^[^ ]*  //' | LC_ALL=C sort))
+fi
+
+printf '%s\n' "$CHANGED" | while IFS= read -r path; do
+  [ -n "$path" ] || continue
+  source_path="$CONFIG_DIR/${path#.git/}"
+  [ -f "$source_path" ] || source_path="$TEMPLATE_DIR/$path"
+  mkdir -p "../$(dirname "$path")"
+  # Copy then rename: this script may be replacing itself while it runs
+  cp "$source_path" "../$path.tmp.$$" && mv -f "../$path.tmp.$$" "../$path"
+done
+
+printf '%s\n' "$STALE" | while IFS= read -r path; do
+  [ -n "$path" ] && rm -f "../$path"
+done
+
+if [ -n "$CHANGED" ]; then
+  chmod +x hooks/*
+fi
+printf '%s\n' "$TEMPLATE_HASHES" > "$MANIFEST_FILE"
 
 # 🧹 Optionally clean up temporary files
-# print_message "$COLOR_GREEN" "Update completed successfully."
\ No newline at end of file
+# print_message "$COLOR_GREEN" "Update completed successfully."
@@ -0,0 +1,10 @@
+# Define valid scopes for the "DMSPurchase" repository
+SCOPES=(
+"authentication" 
+"account-management" 
+"dashboard"
+"reception"
+"supplier-balance"
+"supplier-order"
+"supplier-return"
+)
\ No newline at end of file
@@ -0,0 +1,12 @@
+# Define valid scopes for the "TaskWeb" repository
+SCOPES=(
+"authentication" 
+"account-management" 
+"settings-management"
+"diver"
+"purchase"
+"inventory"
+"labeling"
+"stock-adjustment"
+"sales-zone-replenishment"
+)
\ No newline at end of file
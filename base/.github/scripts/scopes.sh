@@ -0,0 +1,12 @@
+# Define valid scopes for the "BASE" config
+# Scopes are matched exactly; set SCOPE_CASE="insensitive" to accept them in any case
+SCOPE_CASE="sensitive"
+SCOPES=(
+"authentication" 
+"account-management" 
+"settings-management"
+"github-integration"
+"notification"
+"reporting"
+"analytics"
+)
\ No newline at end of file
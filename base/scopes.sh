@@ -1,4 +1,6 @@
 # Define valid scopes for the "BASE" config
+# Scopes are matched exactly; set SCOPE_CASE="insensitive" to accept them in any case
+SCOPE_CASE="sensitive"
 SCOPES=(
 "authentication" 
 "account-management" 
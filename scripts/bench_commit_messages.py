@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Benchmark and fuzz the commit message grammar.
+
+Runs BasicCommitParser.parse and the commit-msg CommitMessageValidator over
+a seeded corpus of realistic messages and over adversarial families (very
+long bodies, many Refs entries, pathological whitespace, unterminated
+scopes...). The run fails when:
+
+- a generated message breaks a parser/validator invariant,
+- the worst-case latency of a single message exceeds --max-latency-ms,
+- an adversarial family scales worse than linearly (the time for a 4x larger
+  message grows by more than --max-growth), which is how catastrophic
+  backtracking shows up,
+- throughput drops more than --tolerance below a saved --baseline.
+
+Usage:
+    python scripts/bench_commit_messages.py [--seed 0] [--count 5000] [--baseline FILE] [--save-baseline FILE]
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+PACKAGE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.github', 'scripts')
+sys.path.insert(0, PACKAGE_ROOT)
+
+from changelogs.basic_commit_parser import BasicCommitParser  # noqa: E402
+from changelogs.commit_grammar import REF_REGEX, SHORT_DESC_LENGTH, TYPES  # noqa: E402
+from changelogs.commit_message_validator import CommitMessageValidator  # noqa: E402
+
+SCOPES = ["Authentication", "Navigation", "API", "Database", "Utility", "Config", "POS", "Stock"]
+WORDS = ("add update remove fix handle improve cache query report user order price "
+         "stock invoice export import sync screen login token session").split()
+
+REF_PATTERN = re.compile(r"^" + REF_REGEX + r"$")
+
+# Base size (characters or repetitions) of each adversarial family, measured at 1x and 4x
+ADVERSARIAL_SIZE = 20000
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def realistic_message(rng: random.Random) -> Tuple[str, Dict]:
+    """A well-formed message and the fields the parser must return for it"""
+    fields = {
+        "type": rng.choice(TYPES),
+        "scope": rng.choice(SCOPES),
+        "title": sentence(rng, rng.randint(2, 12)).capitalize(),
+        "body": "\n".join(sentence(rng, rng.randint(3, 15)) for _ in range(rng.randint(0, 6))) or None,
+        "refs": [f"#{rng.randint(1, 9999)}" for _ in range(rng.randint(0, 4))]
+    }
+    message = f"{fields['type']}({fields['scope']}): {fields['title']}"
+    if fields["body"]:
+        message += f"\n\n{fields['body']}"
+    if fields["refs"]:
+        message += f"\n\nRefs: {', '.join(fields['refs'])}"
+    return message, fields
+
+
+def fuzzed_message(rng: random.Random) -> str:
+    """A realistic message with random characters inserted, deleted or replaced"""
+    chars = list(realistic_message(rng)[0])
+    alphabet = "():,#\n \t\r\x0bRefs" + "".join(WORDS[:4])
+    for _ in range(rng.randint(1, 8)):
+        position = rng.randrange(len(chars) + 1)
+        operation = rng.random()
+        if operation < 0.4:
+            chars.insert(position, rng.choice(alphabet))
+        elif chars and operation < 0.7:
+            del chars[min(position, len(chars) - 1)]
+        elif chars:
+            chars[min(position, len(chars) - 1)] = rng.choice(alphabet)
+    return "".join(chars)
+
+
+# Adversarial families: size -> message
+ADVERSARIAL: Dict[str, Callable[[int], str]] = {
+    "long body": lambda n: "feat(API): Add endpoint\n\n" + "word " * n,
+    "long body, no newline": lambda n: "feat(API): Add endpoint" + " word" * n,
+    "many refs": lambda n: "fix(API): Fix refs\n\nRefs: " + ", ".join(f"#{i}" for i in range(n // 4)),
+    "many refs, bad tail": lambda n: "fix(API): Fix refs\n\nRefs: " + ", ".join(f"#{i}" for i in range(n // 4)) + ", oops",
+    "many refs lines": lambda n: "fix(API): Fix refs\n" + "\nRefs: #1, #2" * (n // 8),
+    "whitespace": lambda n: "feat(API):" + " " * n + "Title" + "\n" * n + " \t" * n,
+    "only whitespace": lambda n: " \n\t" * n,
+    "comment lines": lambda n: "# comment\n" * (n // 5) + "feat(API): Add endpoint",
+    "unterminated scope": lambda n: "feat(" + "a" * n,
+    "nested parens": lambda n: "feat(" + "(" * n + "API" + ")" * n + "): Title",
+    "long title": lambda n: "feat(API): " + "A" * n,
+    "colons": lambda n: "feat(API)" + ":" * n,
+}
+
+
+def git_cleanup(message: str) -> str:
+    """Drop comment lines like `git commit --cleanup=strip`"""
+    return "\n".join(line for line in message.splitlines() if not line.startswith("#"))
+
+
+def check_invariants(parser: BasicCommitParser, validator: CommitMessageValidator, message: str,
+                     expected: Dict = None) -> List[str]:
+    """Property checks that must hold for any message"""
+    errors = []
+    parsed = parser.parse(message)
+    result = validator.validate(message)
+
+    if parsed is not None:
+        if parsed["type"] not in TYPES:
+            errors.append(f"unknown type {parsed['type']!r}")
+        if ")" in parsed["scope"] or not parsed["scope"]:
+            errors.append(f"bad scope {parsed['scope']!r}")
+        if "\n" in parsed["title"]:
+            errors.append("title spans several lines")
+        if any(not REF_PATTERN.match(ref) for ref in parsed["refs"]):
+            errors.append(f"bad refs {parsed['refs']!r}")
+
+    # Everything the hook accepts must be readable by the changelog parser once
+    # git has dropped the comment lines, as it does before storing the commit
+    if result.valid and parser.parse(git_cleanup(message)) is None:
+        errors.append("accepted by the hook but not parsed")
+
+    if expected is not None:
+        if parsed is None:
+            errors.append("well-formed message not parsed")
+        # An empty body is returned as "" or None depending on the trailing blank lines
+        elif dict(parsed, body=parsed["body"] or None) != expected:
+            errors.append(f"parsed {parsed!r}, expected {expected!r}")
+        elif not result.valid and len(expected["title"]) <= SHORT_DESC_LENGTH:
+            errors.append(f"well-formed message rejected: {result.message}")
+    return errors
+
+
+def time_call(function: Callable[[str], object], message: str, repeat: int = 3) -> float:
+    """Fastest of a few calls, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(message)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_corpus(parser, validator, rng: random.Random, count: int) -> Tuple[Dict[str, float], List[str]]:
+    """Throughput and worst-case latency over the realistic and fuzzed corpus"""
+    corpus = [realistic_message(rng) for _ in range(count)]
+    fuzzed = [fuzzed_message(rng) for _ in range(count)]
+
+    failures = []
+    for message, fields in corpus:
+        failures += [f"realistic: {error}: {message[:60]!r}" for error in
+                     check_invariants(parser, validator, message, fields)]
+    for message in fuzzed:
+        failures += [f"fuzzed: {error}: {message[:60]!r}" for error in
+                     check_invariants(parser, validator, message)]
+
+    messages = [message for message, _ in corpus] + fuzzed
+    metrics = {}
+    for name, function in (("parse", parser.parse), ("validate", validator.validate)):
+        worst = 0.0
+        start = time.perf_counter()
+        for message in messages:
+            call_start = time.perf_counter()
+            function(message)
+            worst = max(worst, time.perf_counter() - call_start)
+        elapsed = time.perf_counter() - start
+        metrics[f"{name}_per_sec"] = len(messages) / elapsed
+        metrics[f"{name}_worst_ms"] = worst * 1000
+    return metrics, failures
+
+
+def run_adversarial(parser, validator, max_latency_ms: float, max_growth: float) -> Tuple[Dict[str, float], List[str]]:
+    """Latency of each adversarial family at 1x and 4x size"""
+    metrics = {}
+    failures = []
+    print(f"{'FAMILY':<28}{'STEP':<10}{'1x ms':>10}{'4x ms':>10}{'GROWTH':>9}")
+    for family, build in ADVERSARIAL.items():
+        small, large = build(ADVERSARIAL_SIZE), build(ADVERSARIAL_SIZE * 4)
+        failures += [f"{family}: {error}" for message in (small, large)
+                     for error in check_invariants(parser, validator, message)]
+
+        for name, function in (("parse", parser.parse), ("validate", validator.validate)):
+            small_ms = time_call(function, small) * 1000
+            large_ms = time_call(function, large) * 1000
+            # Ignore growth when both timings are below timer noise
+            growth = large_ms / small_ms if small_ms > 0.05 else 1.0
+            metrics[f"{family}/{name}_ms"] = large_ms
+
+            status = ""
+            if large_ms > max_latency_ms:
+                status = f"over {max_latency_ms:.0f} ms"
+            elif growth > max_growth:
+                status = "superlinear"
+            if status:
+                failures.append(f"{family}/{name}: {status} ({small_ms:.2f} -> {large_ms:.2f} ms)")
+            print(f"{family:<28}{name:<10}{small_ms:>10.2f}{large_ms:>10.2f}{growth:>8.1f}x  {status}")
+    return metrics, failures
+
+
+def compare_baseline(metrics: Dict[str, float], baseline_path: str, tolerance: float) -> List[str]:
+    """Throughput metrics that dropped more than tolerance below the baseline"""
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    failures = []
+    for key, value in metrics.items():
+        if key.endswith("_per_sec") and key in baseline and value < baseline[key] * (1 - tolerance):
+            failures.append(f"{key}: {value:,.0f}/s, baseline {baseline[key]:,.0f}/s")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, help="corpus seed")
+    parser.add_argument("--count", type=int, default=5000, help="realistic and fuzzed messages each")
+    parser.add_argument("--max-latency-ms", type=float, default=50.0,
+                        help="worst-case latency of a single adversarial message")
+    parser.add_argument("--max-growth", type=float, default=8.0,
+                        help="maximum time growth for a 4x larger adversarial message")
+    parser.add_argument("--baseline", help="JSON metrics of a previous run to compare throughput with")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed throughput drop against the baseline")
+    parser.add_argument("--save-baseline", help="write the metrics of this run as a baseline")
+    args = parser.parse_args()
+
+    commit_parser = BasicCommitParser()
+    validator = CommitMessageValidator(SCOPES)
+
+    metrics, failures = run_corpus(commit_parser, validator, random.Random(args.seed), args.count)
+    for name in ("parse", "validate"):
+        print(f"{name:<10}{metrics[f'{name}_per_sec']:>12,.0f} msg/s   worst {metrics[f'{name}_worst_ms']:.3f} ms")
+    print()
+
+    adversarial_metrics, adversarial_failures = run_adversarial(
+        commit_parser, validator, args.max_latency_ms, args.max_growth)
+    metrics.update(adversarial_metrics)
+    failures += adversarial_failures
+
+    if args.baseline:
+        failures += compare_baseline(metrics, args.baseline, args.tolerance)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as file:
+            json.dump(metrics, file, indent=2, sort_keys=True)
+
+    if failures:
+        print(f"\n{len(failures)} failure(s):")
+        for failure in failures[:20]:
+            print(f"  ✘ {failure}")
+        return 1
+    print("\nAll checks passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
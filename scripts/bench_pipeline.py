@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Benchmark the changelog pipeline end to end on synthetic commit histories.
+
+An N-commit corpus is generated in the GitHub API payload shape, with scopes
+read from the repositories' scopes.sh files and configurable type weights.
+It is fed to EnhancedCommitDocumentManager.generate_all_documents through a
+local stand-in fetcher, so the real categorisation, report generators, PDF
+conversion and email rendering run without network access.
+
+Each corpus size runs in a fresh interpreter; the report gives the wall time
+of every pipeline stage, the peak RSS and the size of the generated output.
+PDF conversion is skipped when wkhtmltopdf is not installed.
+
+Usage:
+    python scripts/bench_pipeline.py [--sizes 1000,10000,100000] [--repo DMSPOS]
+                                     [--types feat=30,fix=30,...] [--output results.json]
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_ROOT = os.path.join(ROOT_DIR, '.github', 'scripts')
+sys.path.insert(0, PACKAGE_ROOT)
+
+DEFAULT_SIZES = "1000,10000,100000"
+DEFAULT_TYPES = "feat=30,fix=30,refactor=10,chore=10,docs=6,perf=5,test=5,style=4"
+
+AUTHORS = ["Alice Martin", "Bob Durand", "Chloé Bernard", "David Petit", "Emma Leroy", "Farid Haddad"]
+WORDS = ("add update remove fix handle improve cache query report user order price "
+         "stock invoice export import sync screen login token session").split()
+
+# Share of generated commits that do not follow the commit convention
+INVALID_RATIO = 0.05
+
+
+def load_scopes(repo: str = None) -> List[str]:
+    """Scopes of one repository, or of every repository with a scopes.sh"""
+    from changelogs.commit_message_validator import parse_scopes
+
+    pattern = os.path.join(ROOT_DIR, repo or '*', 'scopes.sh')
+    scopes = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, 'r', encoding='utf-8') as file:
+            scopes.extend(s for s in parse_scopes(file.read(), path)[0] if s not in scopes)
+    if not scopes:
+        raise ValueError(f"No scopes found in {pattern}")
+    return scopes
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """'feat=30,fix=20' -> {'feat': 30.0, 'fix': 20.0}"""
+    weights = {}
+    for item in spec.split(','):
+        name, _, weight = item.partition('=')
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def generate_corpus(size: int, scopes: List[str], type_weights: Dict[str, float], seed: int = 0) -> List[Dict]:
+    """Commits in the shape returned by the GitHub compare and commits APIs, newest first"""
+    rng = random.Random(seed)
+    types, weights = list(type_weights), list(type_weights.values())
+    start = datetime(2024, 1, 1)
+
+    commits = []
+    for i in range(size):
+        if rng.random() < INVALID_RATIO:
+            message = f"Merge branch 'feature/{rng.choice(WORDS)}'"
+        else:
+            title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 10))).capitalize()
+            message = f"{rng.choices(types, weights)[0]}({rng.choice(scopes)}): {title}"
+            if rng.random() < 0.6:
+                message += "\n\n" + "\n".join(
+                    " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 14)))
+                    for _ in range(rng.randint(1, 4))
+                )
+            if rng.random() < 0.5:
+                message += "\nRefs: " + ", ".join(f"#CU-{rng.randint(1, 5000)}" for _ in range(rng.randint(1, 3)))
+
+        author = rng.choice(AUTHORS)
+        commits.append({
+            "sha": f"{rng.getrandbits(160):040x}",
+            "commit": {
+                "message": message,
+                "author": {
+                    "name": author,
+                    "email": f"{author.split()[0].lower()}@example.com",
+                    "date": (start + timedelta(minutes=17 * (size - i))).strftime("%Y-%m-%dT%H:%M:%SZ")
+                }
+            },
+            "parents": [{"sha": f"{rng.getrandbits(160):040x}"}]
+        })
+    return commits
+
+
+def run_pipeline(size: int, scopes: List[str], type_weights: Dict[str, float], seed: int) -> Dict:
+    """Run the pipeline once in this process and return its measurements"""
+    from changelogs.base_interfaces import CommitFetcher
+    from changelogs.basic_commit_parser import BasicCommitParser
+    from changelogs.enhanced_commit_document_manager import EnhancedCommitDocumentManager
+
+    timings: Dict[str, float] = {}
+
+    def timed(stage, function):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timings[stage(*args)] = timings.get(stage(*args), 0.0) + time.perf_counter() - start
+        return wrapper
+
+    start = time.perf_counter()
+    corpus = generate_corpus(size, scopes, type_weights, seed)
+    timings["generate corpus"] = time.perf_counter() - start
+
+    class LocalCommitFetcher(CommitFetcher):
+        """Serves the synthetic corpus as the range between two tags"""
+
+        def get_tags(self):
+            return "v2.0.0", "v1.0.0"
+
+        def get_commit_from_tag(self, tag):
+            return tag
+
+        def get_commits_between_refs(self, base_ref, head_ref):
+            return corpus
+
+        def fetch_commits(self, branch="main"):
+            return corpus
+
+        def _fetch_all_commits(self, branch):
+            return corpus
+
+    workspace = tempfile.mkdtemp(prefix="bench_pipeline_")
+    os.environ.update({
+        'GITHUB_WORKSPACE': workspace,
+        'CHANGELOG_EMAIL': 'true',
+        'EMAIL_OUTPUT_PATH': os.path.join(workspace, 'email_output.html'),
+        'REPO_NAME': 'datamaster-dev-standards'
+    })
+    os.environ.pop('GITHUB_OUTPUT', None)
+
+    try:
+        manager = EnhancedCommitDocumentManager(LocalCommitFetcher(), BasicCommitParser())
+        manager.categorize_commits = timed(lambda *_: "categorize", manager.categorize_commits)
+        manager.render_email = timed(lambda *_: "email", manager.render_email)
+        if not shutil.which('wkhtmltopdf'):
+            manager.generate_pdf = lambda path: None
+
+        start = time.perf_counter()
+        manager.generate_all_documents()
+        timings["pipeline total"] = time.perf_counter() - start
+
+        # Reports may render in worker processes, their timings come from the run's metrics
+        for stage in manager.metrics.stages:
+            if stage["stage"].startswith(("render ", "pdf ", "fold ", "resolve ")):
+                timings[stage["stage"]] = stage["seconds"]
+
+        output_bytes = sum(
+            os.path.getsize(os.path.join(directory, name))
+            for directory, _, names in os.walk(workspace) for name in names
+        )
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    return {
+        "size": size,
+        "stages": timings,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "output_mb": output_bytes / (1024 * 1024),
+        "pdf": bool(shutil.which('wkhtmltopdf'))
+    }
+
+
+def print_results(results: List[Dict]) -> None:
+    stages = []
+    for result in results:
+        stages.extend(stage for stage in result["stages"] if stage not in stages)
+    stages.sort(key=lambda stage: stage == "pipeline total")
+
+    print(f"{'STAGE':<28}" + "".join(f"{result['size']:>14,}" for result in results))
+    for stage in stages:
+        print(f"{stage:<28}" + "".join(
+            f"{result['stages'][stage]:>13.3f}s" if stage in result["stages"] else f"{'-':>14}"
+            for result in results
+        ))
+    print(f"{'peak RSS (MB)':<28}" + "".join(f"{result['peak_rss_mb']:>14.1f}" for result in results))
+    print(f"{'output (MB)':<28}" + "".join(f"{result['output_mb']:>14.2f}" for result in results))
+    if not all(result["pdf"] for result in results):
+        print("\nwkhtmltopdf not found, PDF conversion was skipped")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated corpus sizes")
+    parser.add_argument("--repo", help="take scopes from this repository only (default: all repositories)")
+    parser.add_argument("--types", default=DEFAULT_TYPES, help="commit type weights, e.g. feat=30,fix=20")
+    parser.add_argument("--seed", type=int, default=0, help="corpus seed")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    scopes = load_scopes(args.repo)
+    type_weights = parse_weights(args.types)
+
+    if args.single:
+        # Worker mode: one size in a fresh interpreter, so peak RSS is per size
+        print(json.dumps(run_pipeline(args.single, scopes, type_weights, args.seed)))
+        return 0
+
+    results = []
+    for size in (int(s) for s in args.sizes.split(',')):
+        command = [sys.executable, os.path.abspath(__file__), "--single", str(size),
+                   "--types", args.types, "--seed", str(args.seed)]
+        if args.repo:
+            command += ["--repo", args.repo]
+        completed = subprocess.run(command, capture_output=True, text=True)
+        if completed.returncode != 0:
+            print(completed.stderr, file=sys.stderr)
+            return 1
+        results.append(json.loads(completed.stdout.splitlines()[-1]))
+
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
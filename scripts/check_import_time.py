@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Check the cold-start import cost of the changelog and commit-msg entry points.
+
+Each module is imported in a fresh interpreter with ``-X importtime``; the
+check fails when its cumulative import time exceeds the budget or when it
+pulls in one of the heavy dependencies that must stay on the code paths
+that use them.
+
+The commit-msg hook runs the validator on every commit, so its budget is
+tighter. The hook's end-to-end latency is bound by the interpreter start
+itself (python3 -S, tens of milliseconds depending on the machine); the
+budget covers what the engine adds on top of it.
+
+The same check runs in the test suite (.github/scripts/tests/test_import_time.py).
+
+Usage:
+    python scripts/check_import_time.py [--budget-ms MS] [--runs 5] [module ...]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Optional
+
+# Directory holding the changelogs package
+PACKAGE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.github', 'scripts')
+
+# Entry points checked when no module is given on the command line, with their budget in ms
+DEFAULT_BUDGETS_MS = {
+    "changelogs.main": 50.0,
+    "changelogs.commit_message_validator": 15.0
+}
+DEFAULT_MODULES = list(DEFAULT_BUDGETS_MS)
+
+# Dependencies that must not be imported when loading an entry point
+HEAVY_MODULES = {"requests", "git", "pdfkit", "weasyprint", "github"}
+
+
+def measure(module: str):
+    """Return (cumulative import time in us, imported top-level packages)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PACKAGE_ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import '{module}':\n{result.stderr}")
+
+    cumulative = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if name == "imported package":
+            continue
+        imported.add(name.split(".")[0])
+        if name == module:
+            cumulative = int(cumulative_us)
+
+    return cumulative, imported
+
+
+def check(module: str, budget_ms: Optional[float] = None, runs: int = 5):
+    """Return (best import time in ms, status), the status is "ok" when within budget"""
+    if budget_ms is None:
+        budget_ms = DEFAULT_BUDGETS_MS.get(module, 50.0)
+    samples = [measure(module) for _ in range(runs)]
+    best_ms = min(cumulative for cumulative, _ in samples) / 1000
+    heavy = sorted(HEAVY_MODULES & samples[0][1])
+
+    status = "ok"
+    if best_ms > budget_ms:
+        status = f"over budget ({budget_ms:.0f} ms)"
+    if heavy:
+        status = f"imports {', '.join(heavy)}"
+    return best_ms, status
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--budget-ms", type=float,
+                        help="maximum cumulative import time per module (default: per module, 50 ms)")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="imports per module, the fastest one is kept")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        best_ms, status = check(module, args.budget_ms, args.runs)
+        failed = failed or status != "ok"
+
+        print(f"{module:<40} {best_ms:8.1f} ms  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,7 +16,10 @@ TYPES=("feat" "fix" "docs" "style" "refactor" "perf" "test" "chore")
 # Dynamic horizontal line for styling
 print_line() {
   local length="$1"
-  printf "${WHITE}%*s\n" $((length + 1)) | tr " " "="
+  local line
+  # Built-ins only, no printf | tr pipeline
+  printf -v line "%*s" $((length + 1)) ""
+  echo -e "${WHITE}${line// /=}"
 }
 
 
@@ -92,9 +95,17 @@ SHORT_DESC_TIP_MSG="💡 Tip: Consider shortening your description to fit within
 
 
 
+print_success() {
+    print_line ${#SUCCESS_MSG}
+    echo -e "${GREEN}${BOLD}$SUCCESS_MSG${RESET}"
+    print_line ${#SUCCESS_MSG}
+}
+
+
 # Generate type and scope regex dynamically (no trailing or leading spaces)
 TYPE_REGEX=$(IFS=\|; echo "${TYPES[*]}")
-SCOPE_REGEX=$(IFS=\|; echo "${SCOPES[*]}")
+# Scopes are checked by scope_exists, the pattern only requires one (no regex built from scope names)
+SCOPE_REGEX="[^)]+"
 
 SHORT_DESC_REGEX=".*"  # Matches the short description after the colon
 MULTILINE_DESC_REGEX="[\s\S]+"  # Matches multiline description if any
@@ -105,6 +116,44 @@ COMMIT_MSG_PATTERN="^($TYPE_REGEX)\(($SCOPE_REGEX)\):\s*($SHORT_DESC_REGEX)(\s*$
 # COMMIT_MSG_PATTERN="^($TYPE_REGEX)\(($SCOPE_REGEX)\):\s*($SHORT_DESC_REGEX)(\s*$MULTILINE_DESC_REGEX)?\s*$REFS_REGEX$"
 
 
+# Validate with the Python engine when available, it shares its grammar with the changelog parser
+find_validator() {
+  local script_dir="."
+  [[ "${BASH_SOURCE[0]}" == */* ]] && script_dir="${BASH_SOURCE[0]%/*}"
+  local candidate
+  for candidate in \
+    "$script_dir/changelogs/commit_message_validator.py" \
+    "$script_dir/../../.github/scripts/changelogs/commit_message_validator.py" \
+    ".github/scripts/changelogs/commit_message_validator.py"; do
+    if [[ -f "$candidate" ]]; then
+      # Directory holding the changelogs package, imported with -m
+      VALIDATOR_ROOT="${candidate%/changelogs/commit_message_validator.py}"
+      return 0
+    fi
+  done
+  return 1
+}
+
+if find_validator && command -v python3 > /dev/null 2>&1; then
+  # The hook itself defines SCOPES, the engine caches them keyed by the hook's hash
+  VALIDATOR_OUTPUT=$(PYTHONPATH="$VALIDATOR_ROOT${PYTHONPATH:+:$PYTHONPATH}" \
+    python3 -S -m changelogs.commit_message_validator --hook "${BASH_SOURCE[0]}" "$1" 2> /dev/null)
+  VALIDATOR_STATUS=$?
+  if [[ $VALIDATOR_STATUS -eq 0 ]]; then
+    print_success
+    exit 0
+  elif [[ $VALIDATOR_STATUS -eq 3 ]]; then
+    # 3 is the engine's "invalid message" status, 1 would be an uncaught Python error
+    # First line is the error, an optional second line is a tip
+    VALIDATOR_TIP=""
+    [[ "$VALIDATOR_OUTPUT" == *$'\n'* ]] && VALIDATOR_TIP="${VALIDATOR_OUTPUT#*$'\n'}"
+    print_commit_requirements "${VALIDATOR_OUTPUT%%$'\n'*}" "$VALIDATOR_TIP"
+    exit 1
+  fi
+  # Any other status means the engine itself failed, fall back to the bash validation
+fi
+
+
 # Read the commit message (file or input string)
 if [ -f "$1" ]; then
   COMMIT_MSG=$(<"$1")
@@ -144,12 +193,45 @@ validate_commit_type() {
 }
 
 # Validate the scope
+# Exact scope lookup, case-insensitive when scopes.sh sets SCOPE_CASE="insensitive"
+scope_exists() {
+  local candidate="$1"
+  if [[ "$SCOPE_CASE" == "insensitive" ]]; then
+    candidate=$(echo "$candidate" | tr '[:upper:]' '[:lower:]')
+  fi
+
+  if (( BASH_VERSINFO[0] >= 4 )); then
+    # Hashed lookup table built once from the SCOPES array
+    if [[ -z "$SCOPE_SET_BUILT" ]]; then
+      declare -gA SCOPE_SET
+      local scope
+      for scope in "${SCOPES[@]}"; do
+        [[ "$SCOPE_CASE" == "insensitive" ]] && scope="${scope,,}"
+        SCOPE_SET["$scope"]=1
+      done
+      SCOPE_SET_BUILT=1
+    fi
+    [[ -n "${SCOPE_SET[$candidate]+set}" ]]
+    return
+  fi
+
+  # bash 3 (macOS) has no associative arrays, compare each scope literally
+  local scope
+  for scope in "${SCOPES[@]}"; do
+    if [[ "$SCOPE_CASE" == "insensitive" ]]; then
+      scope=$(echo "$scope" | tr '[:upper:]' '[:lower:]')
+    fi
+    [[ "$scope" == "$candidate" ]] && return 0
+  done
+  return 1
+}
+
 validate_commit_scope() {
   # Extract the scope (if any)
   SCOPE=$(echo "$COMMIT_MSG" | sed -n 's/^[a-zA-Z]*(\([^)]*\)):.*$/\1/p')
 
   # If the scope is not empty, validate it against the allowed list
-  if [[ -n "$SCOPE" && ! " ${SCOPES[@]} " =~ " ${SCOPE} " ]]; then
+  if [[ -n "$SCOPE" ]] && ! scope_exists "$SCOPE"; then
     print_commit_requirements "${INVALID_COMMIT_SCOPE}"
     exit 1
   fi
@@ -203,9 +285,7 @@ validate_refs_line() {
 # Validate full commit message format using regex
 validate_commit_message() {
   if [[ "$COMMIT_MSG" =~ $COMMIT_MSG_PATTERN ]]; then
-    print_line ${#SUCCESS_MSG}
-    echo -e "${GREEN}${BOLD}$SUCCESS_MSG${RESET}"
-    print_line ${#SUCCESS_MSG}
+    print_success
     exit 0
   else
     print_commit_requirements "${ERROR_MSG}"
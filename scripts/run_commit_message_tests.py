@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Run the commit message test cases against every generated per-repo hook.
+
+Cases are read from commit_message_test_cases.json. A "{scope}" placeholder
+in a message is replaced by each scope of the repository, and the cases are
+validated in-process by the Python engine with the scopes of the repository's
+generated hooks/commit-msg. Repositories are checked in parallel.
+
+With --hook, each case is also run through the generated bash hook itself,
+which checks the hook wiring at the cost of one process per case.
+
+Usage:
+    python3 scripts/run_commit_message_tests.py [--hook] [--jobs N] [REPO ...]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+CASES_FILE = os.path.join(SCRIPTS_DIR, "commit_message_test_cases.json")
+
+sys.path.insert(0, os.path.join(ROOT_DIR, ".github", "scripts"))
+
+from changelogs import commit_message_validator  # noqa: E402
+from changelogs.commit_message_validator import CommitMessageValidator, load_scope_index  # noqa: E402
+
+
+def find_repositories() -> List[str]:
+    """Repository directories with a generated commit-msg hook"""
+    return sorted(
+        name for name in os.listdir(ROOT_DIR)
+        if os.path.isfile(os.path.join(ROOT_DIR, name, "hooks", "commit-msg"))
+    )
+
+
+def expand_cases(cases: List[Dict], scopes: List[str]) -> List[Tuple[str, str, str, int]]:
+    """(name, message, expected output, expected exit code) for every scope"""
+    expanded = []
+    for case in cases:
+        expected = getattr(commit_message_validator, case["expected"])
+        targets = scopes if "{scope}" in case["message"] else [None]
+        for scope in targets:
+            message = case["message"].replace("{scope}", scope) if scope else case["message"]
+            name = f"{case['name']} [{scope}]" if scope else case["name"]
+            expanded.append((name, message, expected, case["exit_code"]))
+    return expanded
+
+
+def run_hook(hook: str, message: str) -> Tuple[str, int]:
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as file:
+        file.write(message)
+    try:
+        result = subprocess.run(["bash", hook, file.name], capture_output=True, text=True)
+    finally:
+        os.unlink(file.name)
+    return result.stdout + result.stderr, result.returncode
+
+
+def run_repository(repo: str, cases: List[Dict], use_hook: bool) -> Tuple[str, int, List[str], float]:
+    """Run every case for one repository, return (repo, passed, failures, seconds)"""
+    start = time.perf_counter()
+    hook = os.path.join(ROOT_DIR, repo, "hooks", "commit-msg")
+    index = load_scope_index(hook)
+    validator = CommitMessageValidator(scope_index=index)
+    scopes = [scope for spellings in index.spellings.values() for scope in spellings]
+
+    passed = 0
+    failures = []
+    for name, message, expected, exit_code in expand_cases(cases, scopes):
+        result = validator.validate(message)
+        outputs = [(f"{result.message}\n{result.tip or ''}", 0 if result.valid else 1)]
+        if use_hook:
+            outputs.append(run_hook(hook, message))
+
+        for output, code in outputs:
+            if expected not in output or code != exit_code:
+                failures.append(f"{name}: expected '{expected}' ({exit_code}), got '{output.strip()}' ({code})")
+                break
+        else:
+            passed += 1
+
+    return repo, passed, failures, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the commit message test cases for every repository")
+    parser.add_argument("repos", nargs="*", help="repositories to check (default: all with generated hooks)")
+    parser.add_argument("--hook", action="store_true", help="also run every case through the generated bash hook")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="parallel workers")
+    args = parser.parse_args()
+
+    with open(CASES_FILE, "r", encoding="utf-8") as file:
+        cases = json.load(file)
+    repos = args.repos or find_repositories()
+
+    start = time.perf_counter()
+    failed = False
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(run_repository, repo, cases, args.hook) for repo in repos]
+        for future in futures:
+            repo, passed, failures, seconds = future.result()
+            status = "ok" if not failures else "FAILED"
+            print(f"{repo:<20} {passed:>5}/{passed + len(failures):<5} {seconds:7.2f}s  {status}")
+            for failure in failures:
+                print(f"    ✘ {failure}")
+            failed = failed or bool(failures)
+
+    print(f"\n{len(repos)} repositories checked in {time.perf_counter() - start:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,8 +9,11 @@ COLOR_RED="\033[1;31m"
 COLOR_YELLOW="\033[1;33m"
 
 # Define the URL of the template repository containing the Git hooks and GitHub Actions files
-TEMPLATE_REPO_URL="https://github.com/decodevM/datamaster-dev-standards.git"
-TEMPLATE_DIR=".datamaster-dev-standards"
+TEMPLATE_REPO_URL="${TEMPLATE_REPO_URL:-https://github.com/decodevM/datamaster-dev-standards.git}"
+TEMPLATE_DIR=".git/.temp-templates"  # Cached clone, reused by update-config.sh
+BASE_CONFIG="base"
+# The standards repository's own tests and their workflow, not installed
+TEMPLATE_ONLY_PATHS=(".github/scripts/tests" ".github/workflows/tests.yml")
 
 # 📝 Message Definitions
 MESSAGE_INIT_REPO="❌  .git directory not found. Please initialize the git repository first using 'git init'."
@@ -36,22 +39,32 @@ if [ ! -d ".git" ]; then
 fi
 
 
-rm -rf "$TEMPLATE_DIR"
+# 🔥 Clone the template repository: shallow, without blobs, then only the needed directory
+clone_templates() {
+  # Reuse the cached clone of a previous setup or update
+  if [ -d "$TEMPLATE_DIR/.git" ] &&
+    git -C "$TEMPLATE_DIR" fetch --depth 1 origin main &&
+    git -C "$TEMPLATE_DIR" reset --hard FETCH_HEAD > /dev/null; then
+    return 0
+  fi
+
+  rm -rf "$TEMPLATE_DIR"
+  # Partial clones need git 2.25+, fall back to a plain shallow clone
+  git clone --depth 1 --filter=blob:none --sparse --branch main "$TEMPLATE_REPO_URL" "$TEMPLATE_DIR" ||
+    git clone --depth 1 --branch main "$TEMPLATE_REPO_URL" "$TEMPLATE_DIR"
+}
 
-# 🔥 Clone the template repository
 print_message "$COLOR_YELLOW" "$MESSAGE_CLONE_REPO $TEMPLATE_REPO_URL..."
-git clone "$TEMPLATE_REPO_URL" "$TEMPLATE_DIR"
 
 # 🚨 Check if cloning was successful
-if [ $? -ne 0 ]; then
+if ! clone_templates; then
   rm -rf "$TEMPLATE_DIR"
   print_message "$COLOR_RED" "$MESSAGE_CLONE_FAILED"
   exit 1
 fi
 
-cd "$TEMPLATE_DIR" || exit
-
-if [[ ! -d "$REPOSITORY_NAME" ]]; then
+# Top-level directories are known from the tree alone, no file content is needed
+if [[ -z $(git -C "$TEMPLATE_DIR" ls-tree -d --name-only HEAD -- "$REPOSITORY_NAME") ]]; then
     echo "Error: Repository '$REPOSITORY_NAME' does not exist."
     read -p "Do you want to use the base configuration instead? (yes/no): " USE_BASE
     # Convert input to lowercase for case-insensitive comparison
@@ -59,7 +72,7 @@ if [[ ! -d "$REPOSITORY_NAME" ]]; then
     if [[ "$USE_BASE" =~ ^(yes|y)$ ]]; then
         echo "Using base configuration."
         REPOSITORY_NAME="$BASE_CONFIG"
-        if [[ ! -d "$REPOSITORY_NAME" ]]; then
+        if [[ -z $(git -C "$TEMPLATE_DIR" ls-tree -d --name-only HEAD -- "$REPOSITORY_NAME") ]]; then
             echo "Error: Base configuration directory does not exist."
             rm -rf "$TEMPLATE_DIR"
             exit 1
@@ -71,7 +84,8 @@ if [[ ! -d "$REPOSITORY_NAME" ]]; then
     fi
 fi
 
-cd ..
+# Check out only the shared .github and the selected configuration
+git -C "$TEMPLATE_DIR" sparse-checkout set .github "$REPOSITORY_NAME" > /dev/null 2>&1
 
 # Add the alias to the local repository's Git configuration
 print_message "$COLOR_YELLOW" "Adding alias 'pull-update' to .git/config..."
@@ -85,29 +99,28 @@ else
 fi
 
 # 📂 Copy the selected configuration
-cd "$TEMPLATE_DIR/$REPOSITORY_NAME" || exit
+CONFIG_DIR="$TEMPLATE_DIR/$REPOSITORY_NAME"
 
 # 📑 Copy the GitHub Actions files
 print_message "$COLOR_YELLOW" "$MESSAGE_COPY_ACTIONS"
-rm -rf ../../.github  # Remove existing .github directory
-mkdir ../../.github   # Recreate the .github directory
-cp -r .github/* ../../.github/
+rm -rf .github  # Remove existing .github directory
+mkdir .github   # Recreate the .github directory
+# Shared workflows and scripts, then the repository's own files (commit-msg) on top
+cp -r "$TEMPLATE_DIR/.github/"* .github/
+rm -rf "${TEMPLATE_ONLY_PATHS[@]}"
+cp -r "$CONFIG_DIR/.github/"* .github/
 
 
 # 🔑 Copy the Git hooks
 print_message "$COLOR_YELLOW" "Overwriting existing commit-msg hook..."
-cp hooks/* ../../.git/hooks/
-chmod +x ../../.git/hooks/*
-
+cp "$CONFIG_DIR/hooks/"* .git/hooks/
+chmod +x .git/hooks/*
 
-# 🔄 Return to the main repository folder
-cd ../..
 
 # ✅ Confirm the setup
 print_message "$COLOR_GREEN" "$MESSAGE_SETUP_COMPLETE"
 
-# 🧹 Optionally, remove the template repository after setup
-rm -rf "$TEMPLATE_DIR"
+# 🧹 The template clone is kept in .git, update-config.sh only fetches what changed
 
 # 🎉 Done
 print_message "$COLOR_GREEN" "$MESSAGE_DONE"
\ No newline at end of file
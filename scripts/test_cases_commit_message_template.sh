@@ -11,7 +11,7 @@ BOLD="\033[1m"
 
 # Path to the script under test
 SCRIPT_PATH="./commit-msg"
-TERMINAL_WIDTH=$(tput cols)
+TERMINAL_WIDTH=${COLUMNS:-$(tput cols 2>/dev/null || echo 80)}
 
 
 
@@ -44,7 +44,7 @@ run_test() {
 
     # Create a temporary file for the commit message
     TMP_FILE=$(mktemp)
-    echo -e "$INPUT" > "$TMP_FILE"
+    printf '%s\n' "$INPUT" > "$TMP_FILE"
 
     # Run the script with the temp file as input
     OUTPUT=$(bash "$SCRIPT_PATH" "$TMP_FILE" 2>&1)
@@ -69,199 +69,30 @@ run_test() {
 }
 
 
-# Test 1: Valid commit message with body and footer
-INPUT="feat(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Add new API endpoint
-
-This adds a new API endpoint to handle user data.
-
-Refs: #CU-12345"
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 2: Valid commit message without body
-INPUT="fix(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Fix DB connection issue
-
-Refs: #CU-67890"
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 3: Valid commit message with long description
-INPUT="chore(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Update dependencies
-
-Updated all project dependencies to the latest versions to ensure compatibility with the new security patch and improve performance.
-
-Refs: #CU-112233"
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 4: Invalid commit message with missing scope
-INPUT="feat: Add new feature
-
-Refs: #CU-98765"
-EXPECTED_OUTPUT=$INVALID_COMMIT_TYPE
-EXPECTED_EXIT_CODE="1"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 5: Invalid commit message with unrecognized type
-INPUT="wip(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Work in progress on API endpoint
-
-Refs: #CU-54321"
-EXPECTED_OUTPUT=$INVALID_COMMIT_TYPE
-EXPECTED_EXIT_CODE="1"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 6: Valid commit message with correct footer format
-INPUT="fix(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Fix bug in API response
-
-Refs: #12345"
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 7: Commit message with description exceeding character limit
-INPUT="fix(${SCOPES[RANDOM % ${#SCOPES[@]}]}): This is an excessively long description that should fail validation because it exceeds the character limit allowed for commit messages by the script's standards
-
-Refs: #CU-99999"
-EXPECTED_OUTPUT=$SHORT_DESC_LIMIT
-EXPECTED_EXIT_CODE="1"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 8: Valid commit message with missing Refs footer
-INPUT="feat(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Add database migration script"
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 9: Invalid commit message with an unrecognized scope
-INPUT="fix(Network): Fix connectivity issue
-
-Refs: #CU-77777"
-EXPECTED_OUTPUT=$INVALID_COMMIT_SCOPE
-EXPECTED_EXIT_CODE="1"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 10: Commit message with multiple line breaks in body
-INPUT="chore(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Update testing framework
-
-Updated the testing framework to the latest version. This ensures compatibility with the new codebase.
-
-Refs: #CU-12345"
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-INPUT="fix(@PI): Incorrect scope formatting
-
-Refs: #CU-12345"
-EXPECTED_OUTPUT=$INVALID_COMMIT_SCOPE
-EXPECTED_EXIT_CODE="1"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-
-INPUT=""
-EXPECTED_OUTPUT=$EMPTY_MSG
-EXPECTED_EXIT_CODE="1"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-
-INPUT="feat(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Add new API endpoint
-
-Updated API to handle user data more efficiently.
-Footer without Refs"
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-
-
-INPUT="chore(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Update testing framework
-
-Updated the testing framework to the latest version. This ensures compatibility with the new codebase.
-
-Refs: #CU-12345"
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 11: Commit message with a long multiline description exceeding the allowed character limit
-INPUT="fix(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Fix multiple login issues. This update addresses multiple login-related issues, including: Fixing the broken redirect flow after login, Resolving the issue where users were not able to access their profiles after logging in
-
-- Resolving the issue where users were not able to access their profiles after logging in
-- Improving the performance of the login API to handle higher traffic loads
-
-The fix also ensures that any edge cases related to user authentication and session management are covered.
-
-Refs: #CU-123456"
-EXPECTED_OUTPUT=$SHORT_DESC_LIMIT
-EXPECTED_EXIT_CODE="1"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 12: Commit message with a valid multiline description
-INPUT="feat(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Enhance user profile page
-
-The profile page has been enhanced to include the following changes:
-- Added a new section for displaying user achievements
-- Improved the layout of the profile details
-- Added interactive elements for better user engagement
-
-These updates aim to make the profile page more visually appealing and user-friendly.
-
-Refs: #CU-654321"
-
-
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-
-# Test 13: Commit message with multiple paragraphs in the description
-INPUT="docs(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Update README for new API features
-
-Updated the README to include documentation for the newly added features in the API.
-
-The API now supports additional endpoints for managing user permissions, with improved error handling for invalid requests. Please refer to the updated section for detailed information on each endpoint.
-
-Refs: #CU-987654"
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-# Test 14: Commit message with a description section that exceeds the limit
-INPUT="fix(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Fix chart rendering issue. The chart rendering on the dashboard had an issue where data points were not displayed correctly, especially for larger datasets. 
-The issue was caused by a bug in the data-fetching logic, which resulted in incomplete data being sent to the frontend. The fix ensures that all data is fetched correctly, and the chart now renders without any errors or missing data points.
-
-Refs: #CU-192837"
-EXPECTED_OUTPUT=$SHORT_DESC_LIMIT
-EXPECTED_EXIT_CODE="1"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-
-# Test 15: Commit message with a short description and long body
-INPUT="fix(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Fix layout bug
-
-The layout bug on the settings page was causing the page to display incorrectly on smaller screens. After identifying the root cause, we applied several fixes to ensure that the layout adapts properly on all screen sizes, including mobile and tablet views.
-
-This fix is part of the ongoing effort to improve the user experience across all platforms, ensuring that the app remains usable regardless of the screen size.
-
-Refs: #CU-564738"
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
-
-
-# Test 16: Commit message with a valid structure
-INPUT="chore(${SCOPES[RANDOM % ${#SCOPES[@]}]}): Update build tools
-
-The build tools were updated to ensure compatibility with the latest version of the build system. Several deprecated tools were removed from the build pipeline, and new tools were added to improve the build speed and stability.
-
-This update should result in faster build times and fewer issues during the build process in future releases.
-
-" 
-EXPECTED_OUTPUT=$SUCCESS_MSG
-EXPECTED_EXIT_CODE="0"
-run_test "$INPUT" "$EXPECTED_OUTPUT" "$EXPECTED_EXIT_CODE"
+# The cases come from scripts/commit_message_test_cases.json, shared with
+# scripts/run_commit_message_tests.py; auto_generate embeds the table as
+# TEST_CASES_JSON. A "{scope}" placeholder takes a random scope of the repository.
+if [[ -z "$TEST_CASES_JSON" && -f "$TEST_CASES_FILE" ]]; then
+    TEST_CASES_JSON=$(cat "$TEST_CASES_FILE")
+fi
+if [[ -z "$TEST_CASES_JSON" ]]; then
+    echo -e "${RED}No test cases found, regenerate this script with scripts/auto_generate.${RESET}"
+    exit 1
+fi
+
+# One NUL-separated record per case: message, expected output variable, exit code
+load_test_cases() {
+    TEST_CASES_JSON="$TEST_CASES_JSON" python3 -c '
+import json, os, random, sys
+scopes = sys.argv[1:]
+for case in json.loads(os.environ["TEST_CASES_JSON"]):
+    message = case["message"]
+    if scopes:
+        message = message.replace("{scope}", random.choice(scopes))
+    sys.stdout.write("%s\0%s\0%d\0" % (message, case["expected"], case["exit_code"]))
+' "${SCOPES[@]}"
+}
 
-# Add more tests as needed...
+while IFS= read -r -d '' INPUT && IFS= read -r -d '' EXPECTED && IFS= read -r -d '' EXPECTED_EXIT_CODE; do
+    run_test "$INPUT" "${!EXPECTED}" "$EXPECTED_EXIT_CODE"
+done < <(load_test_cases)